@@ -3,13 +3,17 @@
 支持多账号架构
 """
 
-from typing import Optional
+import asyncio
+from typing import Any, Awaitable, Iterable, List, Optional
 
 from fastapi import Depends, HTTPException, status
 
 from src.app_context import get_app_context
 from src.manager.manager import TradingManager
 
+# 批量操作同时发往Trader的最大请求数
+BATCH_REQUEST_CONCURRENCY = 32
+
 
 def get_trading_manager() -> TradingManager:
     """获取交易管理器（依赖注入）"""
@@ -20,3 +24,25 @@ def get_trading_manager() -> TradingManager:
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="交易管理器未初始化"
         )
     return manager
+
+
+async def gather_limited(
+    aws: Iterable[Awaitable[Any]], limit: int = BATCH_REQUEST_CONCURRENCY
+) -> List[Any]:
+    """
+    并发执行批量请求，同时进行的请求数不超过limit
+
+    Args:
+        aws: 待执行的协程
+        limit: 最大并发数
+
+    Returns:
+        List[Any]: 与输入顺序一致的结果，异常作为结果返回
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=True)
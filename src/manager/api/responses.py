@@ -1,8 +1,8 @@
 """统一响应模型和异常处理器"""
 
-import math
 import traceback
 from datetime import datetime
+from decimal import Decimal
 from typing import Any, Generic, Optional, TypeVar
 
 from fastapi import Request, Response
@@ -29,14 +29,13 @@ def _convert_pydantic_to_dict(obj: Any) -> Any:
     Returns:
         Any: 转换后的对象
     """
-    from decimal import Decimal
-
     if isinstance(obj, datetime):
         return obj.isoformat()
     elif isinstance(obj, Decimal):
         return float(obj)
     elif isinstance(obj, float):
-        return obj if not math.isnan(obj) else None
+        # NaN是唯一不等于自身的浮点数，避免逐值调用math.isnan
+        return obj if obj == obj else None
     elif isinstance(obj, BaseModel):
         return _convert_pydantic_to_dict(obj.model_dump())
     elif isinstance(obj, list):
@@ -105,10 +104,6 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
 
     拦截所有未捕获的异常并返回统一格式
     """
-    from src.utils.logger import get_logger
-
-    logger = get_logger(__name__)
-
     error_message = str(exc)
     traceback_str = traceback.format_exc()
 
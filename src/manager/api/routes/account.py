@@ -2,16 +2,17 @@
 账户相关API路由
 """
 
+from datetime import datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Body, Depends, Query
 
-from src.app_context import get_app_context
 from src.manager.api.dependencies import get_trading_manager
 from src.manager.api.responses import error_response, success_response
 from src.manager.api.schemas import AccountRes, TraderStatusRes
 from src.manager.manager import TradingManager
 from src.models.object import AccountData, TraderState
+from src.utils.config_loader import get_config_loader
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -29,12 +30,8 @@ async def get_account_info(
 
     返回实时账户资金情况
     """
-    from datetime import datetime
-
     try:
         # 从 TradingManager 获取账户数据
-        ctx = get_app_context()
-        trading_manager: TradingManager = ctx.get_trading_manager()
         account_data = await trading_manager.get_account(account_id)
         if not account_data:
             return error_response(code=404, message=f"账户 [{account_id}] 不存在")
@@ -78,16 +75,12 @@ async def get_all_accounts(
     获取所有账户信息（多账号模式）
     返回所有账户的资金情况，按照配置文件中account_ids的顺序排列
     """
-    from datetime import datetime
-
-    from src.utils.config_loader import get_config_loader
-
     try:
         # 从 TradingManager 获取所有账户数据
-        ctx = get_app_context()
-        trading_manager: TradingManager = ctx.get_trading_manager()
         accounts = await trading_manager.get_all_accounts()
         accounts_list = []
+        # 同一次请求的账户共用一个更新时间
+        now = datetime.now()
         for account_info in accounts:
             # 添加 None 检查，避免访问 None 对象的属性
             if account_info is None:
@@ -109,7 +102,7 @@ async def get_all_accounts(
                     today_profit=float(account_info.hold_profit or 0)
                     + float(account_info.close_profit or 0),
                     risk_ratio=float(account_info.risk_ratio or 0),
-                    updated_at=datetime.now(),
+                    updated_at=now,
                     user_id=account_info.user_id or "--",
                     md_connected=account_info.md_connected,
                     td_connected=account_info.td_connected,
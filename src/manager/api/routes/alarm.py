@@ -2,12 +2,12 @@
 告警相关API路由
 """
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import List, Optional
 
-from fastapi import APIRouter, Body, Depends, Query, Request
-from pydantic import BaseModel
-from sqlalchemy import and_, func
+from fastapi import APIRouter, Body, Query, Request
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import and_, case, func, select
 from sqlalchemy.orm import Session
 
 from src.manager.api.responses import error_response, success_response
@@ -19,6 +19,11 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/alarm", tags=["告警"])
 
+# 告警列表整体校验，一次调用完成所有行的转换
+_ALARM_LIST_ADAPTER = TypeAdapter(List[AlarmRes])
+# 告警列表只查询响应需要的列，不构造ORM实体
+_ALARM_COLUMNS = tuple(getattr(AlarmPo, name) for name in AlarmRes.model_fields)
+
 
 class AlarmConfirmReq(BaseModel):
     """告警确认请求"""
@@ -40,25 +45,42 @@ async def get_today_alarms(
     status_filter: Optional[str] = Query(
         None, description="状态筛选: UNCONFIRMED未处理/CONFIRMED已处理，不传则返回全部"
     ),
+    limit: int = Query(200, ge=1, le=1000, description="返回记录数量"),
+    offset: int = Query(0, ge=0, description="偏移量"),
 ):
     """
     获取当日告警列表
 
-    支持按状态筛选：未处理/已处理/全部
+    支持按状态筛选：未处理/已处理/全部，按创建时间倒序分页返回，
+    total为筛选条件下的告警总数，供前端判断是否还有后续页
     """
     db = get_db(request)
     session: Session = db.get_session_sync()
     try:
-        today = datetime.now().strftime("%Y-%m-%d")
-        query = session.query(AlarmPo).filter(AlarmPo.alarm_date == today)
-
+        today = date.today().isoformat()
+        conditions = [AlarmPo.alarm_date == today]
         if status_filter:
-            query = query.filter(AlarmPo.status == status_filter)
-
-        alarms = query.order_by(AlarmPo.created_at.desc()).all()
-        data = [AlarmRes.model_validate(alarm) for alarm in alarms]
+            conditions.append(AlarmPo.status == status_filter)
+
+        total = session.execute(select(func.count(AlarmPo.id)).where(*conditions)).scalar_one()
+        stmt = (
+            select(*_ALARM_COLUMNS)
+            .where(*conditions)
+            .order_by(AlarmPo.created_at.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        alarms = session.execute(stmt).all()
 
-        return success_response(data=data, message="获取成功")
+        return success_response(
+            data={
+                "alarms": _ALARM_LIST_ADAPTER.validate_python(alarms, from_attributes=True),
+                "total": total,
+                "limit": limit,
+                "offset": offset,
+            },
+            message="获取成功",
+        )
     except Exception as e:
         logger.error(f"获取告警列表失败: {e}", exc_info=True)
         return error_response(code=500, message=f"获取告警列表失败: {str(e)}")
@@ -76,39 +98,20 @@ async def get_alarm_stats(request: Request):
     db = get_db(request)
     session: Session = db.get_session_sync()
     try:
-        today = datetime.now().strftime("%Y-%m-%d")
         now = datetime.now()
+        today = now.date().isoformat()
         one_hour_ago = now - timedelta(hours=1)
         five_minutes_ago = now - timedelta(minutes=5)
 
-        # 今日总告警数
-        today_total = (
-            session.query(func.count(AlarmPo.id)).filter(AlarmPo.alarm_date == today).scalar() or 0
-        )
-
-        # 未处理告警数
-        unconfirmed = (
-            session.query(func.count(AlarmPo.id))
-            .filter(and_(AlarmPo.alarm_date == today, AlarmPo.status == "UNCONFIRMED"))
-            .scalar()
-            or 0
-        )
-
-        # 最近1小时告警数
-        last_hour = (
-            session.query(func.count(AlarmPo.id))
-            .filter(AlarmPo.created_at >= one_hour_ago)
-            .scalar()
-            or 0
-        )
-
-        # 最近5分钟告警数
-        last_five_minutes = (
-            session.query(func.count(AlarmPo.id))
-            .filter(AlarmPo.created_at >= five_minutes_ago)
-            .scalar()
-            or 0
-        )
+        # 单条SQL按条件汇总四项计数（今日总数、今日未处理、最近1小时、最近5分钟）
+        is_today = AlarmPo.alarm_date == today
+        row = session.query(
+            func.sum(case((is_today, 1), else_=0)),
+            func.sum(case((and_(is_today, AlarmPo.status == "UNCONFIRMED"), 1), else_=0)),
+            func.sum(case((AlarmPo.created_at >= one_hour_ago, 1), else_=0)),
+            func.sum(case((AlarmPo.created_at >= five_minutes_ago, 1), else_=0)),
+        ).one()
+        today_total, unconfirmed, last_hour, last_five_minutes = (count or 0 for count in row)
 
         data = AlarmStatsRes(
             today_total=today_total,
@@ -173,7 +176,7 @@ async def confirm_all_alarms(
     db = get_db(request)
     session: Session = db.get_session_sync()
     try:
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = date.today().isoformat()
 
         # 构建查询条件：只处理当日未确认的告警
         query = session.query(AlarmPo).filter(
@@ -48,22 +48,26 @@ async def get_contracts(
 
         # 转换字段名称以兼容前端
         result = []
+        # 缺省更新日期每次请求只格式化一次
+        today = datetime.now().strftime("%Y-%m-%d")
         for c in contracts:
-            result.append({
-                "symbol": c.get("symbol", ""),
-                "exchange_id": c.get("exchange", ""),
-                "name": c.get("name", ""),
-                "product_type": c.get("product_type", "FUTURES"),
-                "volume_multiple": c.get("multiple", 1),
-                "price_tick": c.get("pricetick", 0.01),
-                "min_volume": c.get("min_volume", 1),
-                "min_open_volume": c.get("min_open_volume", 1),
-                "option_strike": c.get("option_strike"),
-                "option_underlying": c.get("option_underlying"),
-                "option_type": c.get("option_type"),
-                "update_date": c.get("update_date", datetime.now().strftime("%Y-%m-%d")),
-                "updated_at": None,
-            })
+            result.append(
+                {
+                    "symbol": c.get("symbol", ""),
+                    "exchange_id": c.get("exchange", ""),
+                    "name": c.get("name", ""),
+                    "product_type": c.get("product_type", "FUTURES"),
+                    "volume_multiple": c.get("multiple", 1),
+                    "price_tick": c.get("pricetick", 0.01),
+                    "min_volume": c.get("min_volume", 1),
+                    "min_open_volume": c.get("min_open_volume", 1),
+                    "option_strike": c.get("option_strike"),
+                    "option_underlying": c.get("option_underlying"),
+                    "option_type": c.get("option_type"),
+                    "update_date": c.get("update_date", today),
+                    "updated_at": None,
+                }
+            )
 
         return success_response(data=result, message="获取成功")
     except Exception as e:
@@ -2,19 +2,13 @@
 定时任务配置相关API路由
 """
 
-from datetime import datetime
-from typing import List, Optional
-
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 
-from src.app_context import get_app_context
 from src.manager.api.dependencies import get_trading_manager
 from src.manager.api.responses import error_response, success_response
 from src.manager.manager import TradingManager
-from src.models.po import JobPo
 from src.utils.logger import get_logger
-from src.utils.scheduler import TaskScheduler
 
 logger = get_logger(__name__)
 
@@ -2,11 +2,13 @@
 委托单相关API路由
 """
 
+from datetime import datetime
+from itertools import islice
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query
 
-from src.manager.api.dependencies import get_trading_manager
+from src.manager.api.dependencies import gather_limited, get_trading_manager
 from src.manager.api.responses import error_response, success_response
 from src.manager.api.schemas import ManualOrderReq, OrderRes
 from src.manager.manager import TradingManager
@@ -35,30 +37,17 @@ async def get_orders(
     - REJECTED: 废单（包括REJECTED状态和FINISHED但未成交任何数量的订单）
     - account_id: 可选，指定账户ID筛选（多账号模式）
     """
-    from datetime import datetime
-
     try:
-        # 从 TradingManager 获取订单数据
-        orders_list = await trading_manager.get_orders(account_id)
-
-        # 按状态筛选
-        if status:
-            if status == "REJECTED":
-                orders_list = [
-                    order for order in orders_list if order.status == OrderStatus.REJECTED
-                ]
-            elif status == "FINISHED":
-                orders_list = [
-                    order for order in orders_list if order.status == OrderStatus.FINISHED
-                ]
-            else:
-                orders_list = [
-                    order for order in orders_list if order.status == OrderStatus.PENDING
-                ]
-
-        total_count = len(orders_list)
-        end_index = offset + limit
-        paginated_orders = orders_list[offset:end_index]
+        # 按状态筛选由Trader端完成，只传输所需订单
+        if status and status not in (OrderStatus.REJECTED, OrderStatus.FINISHED):
+            orders = await trading_manager.get_active_orders(account_id)
+        else:
+            orders = await trading_manager.get_orders(account_id, status)
+
+        # 分页只遍历到当前页末尾，不构造完整的筛选列表
+        paginated_orders = islice(orders, offset, offset + limit)
+        # 同一次请求的委托单共用一个时间戳
+        now = datetime.now()
 
         return success_response(
             data=[
@@ -85,10 +74,10 @@ async def get_orders(
                         else str(order.price_type)
                     ),
                     status=order.status,
-                    insert_date_time=order.insert_time or datetime.now(),
+                    insert_date_time=order.insert_time or now,
                     last_msg=order.status_msg or "",
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
+                    created_at=now,
+                    updated_at=now,
                 )
                 for order in paginated_orders
             ],
@@ -111,8 +100,6 @@ async def get_order_by_id(
     - **order_id**: 委托单ID
     - **account_id**: 可选，指定账户ID筛选（多账号模式）
     """
-    from datetime import datetime
-
     # 如果没有指定 account_id，从所有账户中查找
     if account_id:
         trader = trading_manager.get_trader(account_id)
@@ -209,6 +196,20 @@ async def create_manual_order(
     return success_response(data={"order_id": order_id}, message="下单成功")
 
 
+async def _send_cancel(
+    trading_manager: TradingManager, order_id: str, account_id: Optional[str] = None
+) -> bool:
+    """发送撤单请求，未指定账户时依次尝试所有账户"""
+    if account_id:
+        trader = trading_manager.get_trader(account_id)
+        return bool(trader) and await trader.send_cancel_request(order_id)
+    for acc_id in trading_manager.get_all_account_ids():
+        trader = trading_manager.get_trader(acc_id)
+        if trader and await trader.send_cancel_request(order_id):
+            return True
+    return False
+
+
 @router.delete("/{order_id}")
 async def cancel_order(
     order_id: str,
@@ -230,14 +231,7 @@ async def cancel_order(
         success = await trader.send_cancel_request(order_id)
     else:
         # 从所有账户中查找并撤销订单
-        success = False
-        for acc_id in trading_manager.get_all_account_ids():
-            trader = trading_manager.get_trader(acc_id)
-            if trader:
-                result = await trader.send_cancel_request(order_id)
-                if result:
-                    success = True
-                    break
+        success = await _send_cancel(trading_manager, order_id)
 
     if not success:
         return error_response(code=500, message="撤单失败")
@@ -262,29 +256,12 @@ async def cancel_batch_orders(
     if not order_ids:
         return error_response(code=400, message="请提供要撤销的委托单ID列表")
 
-    success_count = 0
-    failed_orders = []
-
-    for order_id in order_ids:
-        success = False
-        if account_id:
-            trader = trading_manager.get_trader(account_id)
-            if trader:
-                success = await trader.send_cancel_request(order_id)
-        else:
-            # 从所有账户中查找并撤销订单
-            for acc_id in trading_manager.get_all_account_ids():
-                trader = trading_manager.get_trader(acc_id)
-                if trader:
-                    result = await trader.send_cancel_request(order_id)
-                    if result:
-                        success = True
-                        break
-
-        if success:
-            success_count += 1
-        else:
-            failed_orders.append(order_id)
+    # 各委托单的撤单请求并发发送，总耗时约为单次请求往返时间
+    results = await gather_limited(
+        _send_cancel(trading_manager, order_id, account_id) for order_id in order_ids
+    )
+    failed_orders = [order_id for order_id, result in zip(order_ids, results) if result is not True]
+    success_count = len(order_ids) - len(failed_orders)
 
     return success_response(
         data={
@@ -2,13 +2,12 @@
 持仓相关API路由
 """
 
-import math
 from datetime import datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query
 
-from src.manager.api.dependencies import get_trading_manager
+from src.manager.api.dependencies import gather_limited, get_trading_manager
 from src.manager.api.responses import error_response, success_response
 from src.manager.api.schemas import PositionRes
 from src.utils.logger import get_logger
@@ -46,6 +45,7 @@ async def get_positions(
                 continue
             positions_list.extend(positions)
 
+        now = datetime.now()
         return success_response(
             data=[
                 PositionRes(
@@ -65,7 +65,7 @@ async def get_positions(
                     close_profit_short=pos.close_profit_short,
                     margin_long=pos.margin_long,
                     margin_short=pos.margin_short,
-                    updated_at=pos.updated_at or datetime.now(),
+                    updated_at=pos.updated_at or now,
                 )
                 for pos in positions_list
             ],
@@ -104,6 +104,7 @@ async def get_position_by_symbol(
         if not result_positions:
             return success_response(data=[], message="获取成功")
 
+        now = datetime.now()
         return success_response(
             data=[
                 PositionRes(
@@ -120,15 +121,18 @@ async def get_position_by_symbol(
                     ),
                     pos_long=pos.pos_long,
                     pos_short=pos.pos_short,
+                    # NaN是唯一不等于自身的浮点数
                     open_price_long=(
-                        None if math.isnan(pos.open_price_long) else pos.open_price_long
+                        pos.open_price_long if pos.open_price_long == pos.open_price_long else None
                     ),
                     open_price_short=(
-                        None if math.isnan(pos.open_price_short) else pos.open_price_short
+                        pos.open_price_short
+                        if pos.open_price_short == pos.open_price_short
+                        else None
                     ),
                     float_profit=float(pos.float_profit_long) + float(pos.float_profit_short),
                     margin=float(pos.margin_long) + float(pos.margin_short),
-                    updated_at=pos.updated_at or datetime.now(),
+                    updated_at=pos.updated_at or now,
                 )
                 for pos in result_positions
             ],
@@ -225,8 +229,9 @@ async def close_batch_positions(
     if not trader:
         return error_response(code=404, message=f"账户 [{account_id}] 不存在")
 
-    success_count = 0
     failed_orders = []
+    valid_positions = []
+    order_requests = []
 
     for pos in positions:
         try:
@@ -252,21 +257,30 @@ async def close_batch_positions(
                 failed_orders.append({"error": "参数类型错误", "position": pos})
                 continue
 
-            order_id = await trader.send_order_request(
-                symbol=symbol,
-                direction=direction,
-                offset=offset,
-                volume=int(volume),
-                price=float(price),
+            order_requests.append(
+                {
+                    "symbol": symbol,
+                    "direction": direction,
+                    "offset": offset,
+                    "volume": int(volume),
+                    "price": float(price),
+                }
             )
-
-            if order_id:
-                success_count += 1
-            else:
-                failed_orders.append({"error": "下单失败", "position": pos})
+            valid_positions.append(pos)
         except Exception as e:
             failed_orders.append({"error": str(e), "position": pos})
 
+    # 校验通过的平仓请求并发发送，总耗时约为单次请求往返时间
+    results = await gather_limited(trader.send_order_request(**req) for req in order_requests)
+    success_count = 0
+    for pos, result in zip(valid_positions, results):
+        if isinstance(result, Exception):
+            failed_orders.append({"error": str(result), "position": pos})
+        elif result:
+            success_count += 1
+        else:
+            failed_orders.append({"error": "下单失败", "position": pos})
+
     return success_response(
         data={
             "success_count": success_count,
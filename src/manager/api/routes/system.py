@@ -273,6 +273,8 @@ async def get_trader_status(
                 "last_heartbeat": None,
                 "restart_count": 0,
                 "socket_path": None,
+                "cpu_usage": 0.0,
+                "memory_usage": 0.0,
             },
             message="获取成功",
         )
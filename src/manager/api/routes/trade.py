@@ -43,6 +43,8 @@ async def get_trades(
         trades_list.sort(key=lambda x: x.trade_time or 0, reverse=True)
 
         data = []
+        # 同一次请求的成交记录共用一个时间戳
+        now = datetime.now()
         for trade in trades_list:
             # 将 datetime 转换为 Unix 时间戳（秒）
             trade_time_ts = 0
@@ -70,9 +72,9 @@ async def get_trades(
                     price=float(trade.price),
                     volume=trade.volume,
                     trade_date_time=(
-                        datetime.fromtimestamp(trade_time_ts) if trade_time_ts else datetime.now()
+                        datetime.fromtimestamp(trade_time_ts) if trade_time_ts else now
                     ),
-                    created_at=datetime.now(),
+                    created_at=now,
                 )
             )
 
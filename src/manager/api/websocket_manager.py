@@ -5,7 +5,7 @@ WebSocket管理模块
 import asyncio
 import json
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 import simplejson as json
 from fastapi import WebSocket
@@ -17,12 +17,18 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 ctx: AppContext = get_app_context()
 
+# 行情推送合并间隔（秒）：间隔内同一合约只推送最新一笔行情
+QUOTE_FLUSH_INTERVAL = 0.02
+
 
 class WebSocketManager:
     """WebSocket连接管理器"""
 
     def __init__(self):
         self.active_connections: set[WebSocket] = set()
+        # 待推送的最新行情，key为合约代码
+        self._pending_quotes: Dict[str, dict] = {}
+        self._quote_flush_task: Optional[asyncio.Task] = None
 
     def start(self):
         event_engine: EventEngine = ctx.get(AppContext.KEY_EVENT_ENGINE)
@@ -51,18 +57,18 @@ class WebSocketManager:
         if not self.active_connections:
             return
         message_str = json.dumps(message, ignore_nan=True)
-        disconnected = set()
-
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message_str)
-            except Exception as e:
-                logger.error(f"发送消息失败: {e}")
-                disconnected.add(connection)
+        # 消息只序列化一次，并发发送给所有连接，单个慢连接不阻塞其他连接
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(message_str) for connection in connections),
+            return_exceptions=True,
+        )
 
-        # 清理断开的连接
-        for connection in disconnected:
-            await self.disconnect(connection)
+        # 清理发送失败的连接
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"发送消息失败: {result}")
+                await self.disconnect(connection)
 
     async def broadcast_account(self, account_data: dict) -> None:
         """广播账户信息更新"""
@@ -105,14 +111,31 @@ class WebSocketManager:
         )
 
     async def broadcast_quote(self, quote_data: dict) -> None:
-        """广播行情更新"""
-        await self.broadcast(
-            {
-                "type": "quote_update",
-                "data": quote_data,
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
+        """
+        广播行情更新
+
+        行情先按合约合并，由后台任务每隔QUOTE_FLUSH_INTERVAL推送各合约最新行情，
+        事件分发无需等待逐个连接发送
+        """
+        if not self.active_connections:
+            return
+        self._pending_quotes[quote_data.get("symbol", "")] = quote_data
+        if self._quote_flush_task is None or self._quote_flush_task.done():
+            self._quote_flush_task = asyncio.create_task(self._flush_quotes())
+
+    async def _flush_quotes(self) -> None:
+        """推送合并后的最新行情，直到没有待推送行情"""
+        while self._pending_quotes:
+            await asyncio.sleep(QUOTE_FLUSH_INTERVAL)
+            quotes, self._pending_quotes = self._pending_quotes, {}
+            for quote_data in quotes.values():
+                await self.broadcast(
+                    {
+                        "type": "quote_update",
+                        "data": quote_data,
+                        "timestamp": datetime.now().isoformat(),
+                    }
+                )
 
     async def broadcast_account_status(self, status_data: dict) -> None:
         """广播账户状态更新（暂停/恢复、连接/断开等）"""
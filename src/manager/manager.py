@@ -6,7 +6,7 @@
 import asyncio
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.app_context import AppContext, get_app_context
 from src.manager.trader_proxy import TraderProxy
@@ -57,8 +57,12 @@ class TradingManager:
         socket_dir = self.socket_config.socket_dir
         Path(socket_dir).mkdir(parents=True, exist_ok=True)
 
-        # Trader Proxy 实例（独立模式）
+        # Trader Proxy 实例（独立模式），读操作无锁
         self.traders: Dict[str, TraderProxy] = {}
+        # 账户ID缓存，仅在traders成员变化时失效
+        self._trader_ids: Optional[Tuple[str, ...]] = None
+        # 账户级生命周期锁（按account_id分片）：同一账户串行，不同账户互不阻塞
+        self._trader_locks: Dict[str, asyncio.Lock] = {}
 
         # 运行状态
         self._running = False
@@ -71,6 +75,21 @@ class TradingManager:
         logger.info("交易管理器初始化完成")
 
     # ==================== Trader Proxy管理 ====================
+    def _get_trader_lock(self, account_id: str) -> asyncio.Lock:
+        """
+        获取账户级生命周期锁
+
+        Args:
+            account_id: 账户ID
+
+        Returns:
+            该账户对应的锁
+        """
+        lock = self._trader_locks.get(account_id)
+        if lock is None:
+            lock = self._trader_locks[account_id] = asyncio.Lock()
+        return lock
+
     async def create_trader(self, account_id) -> bool:
         """
         创建指定账户的Trader Proxy
@@ -86,8 +105,12 @@ class TradingManager:
             logger.error(f"未找到账号 [{account_id}] 的配置")
             return False
 
-        trader = TraderProxy(account_config=account_config)
-        self.traders[account_id] = trader
+        async with self._get_trader_lock(account_id):
+            if account_id in self.traders:
+                return True
+            trader = TraderProxy(account_config=account_config)
+            self.traders[account_id] = trader
+            self._trader_ids = None
         logger.info(f"Trader Proxy [{account_id}] 初始化完成（enabled: {account_config.enabled}）")
         return True
 
@@ -102,6 +125,11 @@ class TradingManager:
             是否启动成功
         """
 
+        async with self._get_trader_lock(account_id):
+            return await self._start_trader(account_id)
+
+    async def _start_trader(self, account_id: str) -> bool:
+        """启动指定Trader（调用方需持有账户锁）"""
         # 启动Trader Proxy（会自动检测进程是否已存在）
         try:
             trader = self.traders.get(account_id)
@@ -129,6 +157,11 @@ class TradingManager:
         Returns:
             是否停止成功
         """
+        async with self._get_trader_lock(account_id):
+            return await self._stop_trader(account_id)
+
+    async def _stop_trader(self, account_id: str) -> bool:
+        """停止指定Trader（调用方需持有账户锁）"""
         trader = self.traders.get(account_id)
         if not trader:
             logger.warning(f"Trader [{account_id}] 未运行")
@@ -165,14 +198,15 @@ class TradingManager:
             logger.warning(f"未找到账号 [{account_id}] 的配置")
             return False
 
-        # 停止
-        await self.stop_trader(account_id)
+        async with self._get_trader_lock(account_id):
+            # 停止
+            await self._stop_trader(account_id)
 
-        # 等待一秒
-        await asyncio.sleep(1)
+            # 等待一秒
+            await asyncio.sleep(1)
 
-        # 启动
-        return await self.start_trader(account_id)
+            # 启动
+            return await self._start_trader(account_id)
 
     def is_running(self, account_id: str) -> bool:
         """
@@ -189,6 +223,18 @@ class TradingManager:
             return trader.is_running()
         return False
 
+    def get_trader_ids(self) -> Tuple[str, ...]:
+        """
+        获取已创建Trader的账户ID
+
+        Returns:
+            账户ID元组（缓存，traders成员变化时重建）
+        """
+        ids = self._trader_ids
+        if ids is None:
+            ids = self._trader_ids = tuple(self.traders)
+        return ids
+
     def get_trader_status(self, account_id: str) -> Optional[Dict]:
         """
         获取Trader状态
@@ -211,10 +257,8 @@ class TradingManager:
         Returns:
             状态列表
         """
-        statuses = []
-        for trader in self.traders.values():
-            statuses.append(trader.get_status())
-        return statuses
+        traders = self.traders
+        return [traders[account_id].get_status() for account_id in self.get_trader_ids()]
 
     # ==================== 交易接口 ====================
 
@@ -328,7 +372,7 @@ class TradingManager:
             {"success": bool, "results": {account_id: {"success": bool, "message": str}}}
         """
         results = {}
-        account_ids = [account_id] if account_id else list(self.traders.keys())
+        account_ids = (account_id,) if account_id else self.get_trader_ids()
 
         for acc_id in account_ids:
             trader = self.traders.get(acc_id)
@@ -372,7 +416,7 @@ class TradingManager:
         seen_symbols: set[str] = set()
 
         # 确定要查询的账户列表
-        account_ids = [account_id] if account_id else list(self.traders.keys())
+        account_ids = (account_id,) if account_id else self.get_trader_ids()
 
         for acc_id in account_ids:
             trader = self.traders.get(acc_id)
@@ -414,17 +458,19 @@ class TradingManager:
             return await trader.get_order(order_id)
         return None
 
-    async def get_orders(self, account_id: Optional[str] = None) -> List[OrderData]:
-        """获取订单列表"""
+    async def get_orders(
+        self, account_id: Optional[str] = None, status: Optional[str] = None
+    ) -> List[OrderData]:
+        """获取订单列表，指定status时只返回该状态的订单"""
         if account_id:
             trader = self.traders.get(account_id)
             if trader:
-                return await trader.get_orders()
+                return await trader.get_orders(status)
             return []
         # 获取所有账户的订单
         all_orders = []
         for trader in self.traders.values():
-            all_orders.extend(await trader.get_orders())
+            all_orders.extend(await trader.get_orders(status))
         return all_orders
 
     async def get_active_orders(self, account_id: Optional[str] = None) -> List[Any]:
@@ -704,17 +750,24 @@ class TradingManager:
         accounts = [acc for acc in self.account_configs]
         logger.info(f"识别到账号: {[acc.account_id for acc in accounts]}")
 
-        # 启动所有Trader
+        # 并发启动所有Trader（各账户连接相互独立，启动耗时取决于最慢的账户）
+        account_ids = []
         for account in accounts:
             if account.account_id is None:
                 logger.warning(f"跳过没有 account_id 的账户配置")
                 continue
-            await self.create_trader(account.account_id)
-            success = await self.start_trader(account.account_id)
-            if success:
-                logger.info(f"Trader Proxy [{account.account_id}] 启动成功")
+            account_ids.append(account.account_id)
+        results = await asyncio.gather(
+            *(self._bootstrap_trader(account_id) for account_id in account_ids),
+            return_exceptions=True,
+        )
+        for account_id, result in zip(account_ids, results):
+            if result is True:
+                logger.info(f"Trader Proxy [{account_id}] 启动成功")
+            elif isinstance(result, BaseException):
+                logger.error(f"Trader Proxy [{account_id}] 启动异常: {result}")
             else:
-                logger.error(f"Trader Proxy [{account.account_id}] 启动失败")
+                logger.error(f"Trader Proxy [{account_id}] 启动失败")
 
         # 初始化并启动 Scheduler（复用 utils/scheduler.py）
         from src.manager.job_mgr import ManagerJobManager
@@ -735,6 +788,19 @@ class TradingManager:
 
         logger.info("交易管理器启动完成")
 
+    async def _bootstrap_trader(self, account_id: str) -> bool:
+        """
+        创建并启动单个Trader
+
+        Args:
+            account_id: 账户ID
+
+        Returns:
+            是否启动成功
+        """
+        await self.create_trader(account_id)
+        return await self.start_trader(account_id)
+
     async def stop(self) -> None:
         """停止管理器"""
         if not self._running:
@@ -743,9 +809,11 @@ class TradingManager:
         self._running = False
         logger.info("交易管理器停止中...")
 
-        # 停止所有Trader
-        for account_id in list(self.traders.keys()):
-            await self.stop_trader(account_id)
+        # 并发停止所有Trader（各账户断开相互独立）
+        await asyncio.gather(
+            *(self.stop_trader(account_id) for account_id in self.get_trader_ids()),
+            return_exceptions=True,
+        )
 
         # 停止 ManagerScheduler
         if self._scheduler:
@@ -17,10 +17,11 @@ Trader Proxy 模块
 
 import asyncio
 import os
+import time
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
 from src.app_context import AppContext, get_app_context
 from src.models.object import AccountData, OrderData, PositionData, TickData, TradeData, TraderState
@@ -33,6 +34,31 @@ from src.utils.scheduler import Job
 logger = get_logger(__name__)
 ctx: AppContext = get_app_context()
 
+# 推送类型 -> 事件类型
+_PUSH_EVENT_TYPES: Dict[str, str] = {
+    "account": EventTypes.ACCOUNT_UPDATE,
+    "order": EventTypes.ORDER_UPDATE,
+    "trade": EventTypes.TRADE_UPDATE,
+    "position": EventTypes.POSITION_UPDATE,
+    "tick": EventTypes.TICK_UPDATE,
+}
+
+# 高频推送类型，同一轮事件循环内合并后批量投递
+_BATCHED_PUSH_TYPES = frozenset({"order", "trade", "tick"})
+
+
+def _sysconf(name: str) -> int:
+    """读取系统常量，不支持的平台（如Windows）返回0"""
+    try:
+        return os.sysconf(name)
+    except (AttributeError, ValueError, OSError):
+        return 0
+
+
+# /proc 采样所需的系统常量，为0时不采样
+_CLK_TCK = _sysconf("SC_CLK_TCK")
+_PAGE_SIZE = _sysconf("SC_PAGE_SIZE")
+
 
 class TraderProxy:
     """
@@ -46,6 +72,12 @@ class TraderProxy:
     INITIAL_INTERVAL = 0.5  # 初始间隔0.5秒
     MAX_INTERVAL = 30.0  # 最大间隔30秒
 
+    # 合约列表缓存有效期（秒），合约仅在换日/强制刷新时变化
+    CONTRACTS_CACHE_TTL = 300.0
+
+    # 子进程资源采样最小间隔（秒）
+    PROC_STATS_INTERVAL = 1.0
+
     def __init__(
         self,
         account_config: AccountConfig,
@@ -86,6 +118,20 @@ class TraderProxy:
         self.socket_client: Optional[SocketClient] = None
         self._connect_task: Optional[asyncio.Task] = None
 
+        # ==================== 事件批量投递 ====================
+        self._pending_events: List[Tuple[str, Any]] = []
+        self._flush_scheduled = False
+
+        # ==================== 合约缓存 ====================
+        # (缓存时间, 合约列表)，状态变化或强制刷新时失效
+        self._contracts_cache: Optional[Tuple[float, Tuple[dict, ...]]] = None
+
+        # ==================== 进程资源采样 ====================
+        # 缓存的CPU/内存占用，get_status按最小间隔惰性刷新
+        self._proc_stats: Dict[str, float] = {"cpu_usage": 0.0, "memory_usage": 0.0}
+        # 上次采样 (pid, 采样时间, CPU累计ticks)
+        self._proc_sample: Optional[Tuple[int, float, int]] = None
+
         logger.info(f"TraderProxy [{self.account_id}] 初始化完成，状态: STOPPED")
 
     # ==================== 状态管理 ====================
@@ -105,6 +151,7 @@ class TraderProxy:
             old_state = self._state
             self._state = new_state
             if old_state != new_state:
+                self._contracts_cache = None
                 logger.info(f"TraderProxy [{self.account_id}] 状态变更: {old_state} -> {new_state}")
 
         # 状态变化时触发账户更新事件，通知前端刷新
@@ -398,31 +445,47 @@ class TraderProxy:
         """
         提交到事件驱动中
 
+        订单/成交/行情等高频数据在同一轮事件循环内合并，批量投递到事件引擎；
+        账户/持仓等低频数据先冲刷已缓冲的事件再立即投递，保证顺序。
+
         Args:
             data_type: 数据类型
             data: 数据
         """
-        event_type = None
-        if data_type == "account":
-            event_type = EventTypes.ACCOUNT_UPDATE
-        elif data_type == "order":
-            event_type = EventTypes.ORDER_UPDATE
-        elif data_type == "trade":
-            event_type = EventTypes.TRADE_UPDATE
-        elif data_type == "position":
-            event_type = EventTypes.POSITION_UPDATE
-        elif data_type == "tick":
-            event_type = EventTypes.TICK_UPDATE
-        elif data_type == "alarm":
+        if data_type == "alarm":
             # 告警类型：保存到数据库并触发事件
             self._handle_alarm_data(data)
             return
 
-        if event_type:
-            event_engine = ctx.get_event_engine()
-            if event_engine:
-                event_engine.put(event_type, data)
-                logger.debug(f"推送事件 [{event_type}] 从Trader [{self.account_id}]")
+        event_type = _PUSH_EVENT_TYPES.get(data_type)
+        if event_type is None:
+            return
+
+        if data_type in _BATCHED_PUSH_TYPES:
+            self._pending_events.append((event_type, data))
+            if not self._flush_scheduled:
+                try:
+                    asyncio.get_running_loop().call_soon(self._flush_events)
+                    self._flush_scheduled = True
+                except RuntimeError:
+                    # 无运行中的事件循环，直接冲刷
+                    self._flush_events()
+            return
+
+        self._flush_events()
+        event_engine = ctx.get_event_engine()
+        if event_engine:
+            event_engine.put(event_type, data)
+
+    def _flush_events(self) -> None:
+        """将缓冲的高频事件批量投递到事件引擎"""
+        self._flush_scheduled = False
+        if not self._pending_events:
+            return
+        events, self._pending_events = self._pending_events, []
+        event_engine = ctx.get_event_engine()
+        if event_engine:
+            event_engine.put_batch(events)
 
     def _handle_alarm_data(self, data: Dict) -> None:
         """
@@ -501,11 +564,12 @@ class TraderProxy:
         data = await self.socket_client.request("get_order", {"order_id": order_id}, timeout=5.0)
         return OrderData(**data) if data else None
 
-    async def get_orders(self) -> List[OrderData]:
-        """实时获取所有订单数据"""
+    async def get_orders(self, status: Optional[str] = None) -> List[OrderData]:
+        """实时获取订单数据，指定status时由Trader端筛选"""
         if not self.socket_client:
             return []
-        data = await self.socket_client.request("get_orders", {}, timeout=5.0)
+        request_data = {"status": status} if status else {}
+        data = await self.socket_client.request("get_orders", request_data, timeout=5.0)
         if data:
             items = cast(List[Dict[str, Any]], data)
             return [OrderData(**item) for item in items]
@@ -1218,6 +1282,48 @@ class TraderProxy:
             return heartbeat_age < self.heartbeat_timeout
         return False
 
+    def _sample_proc_stats(self) -> Dict[str, float]:
+        """
+        采样子进程CPU/内存占用
+
+        读取 /proc/<pid>/stat，两次采样间隔不足 PROC_STATS_INTERVAL 时直接返回缓存值，
+        高频轮询状态不会重复产生系统调用。不支持 /proc 或 sysconf 的平台返回 0。
+
+        Returns:
+            {"cpu_usage": CPU占用百分比, "memory_usage": 常驻内存(MB)}
+        """
+        pid = self.process.pid if self.process else None
+        if pid is None or not _CLK_TCK or not _PAGE_SIZE:
+            self._proc_sample = None
+            self._proc_stats = {"cpu_usage": 0.0, "memory_usage": 0.0}
+            return self._proc_stats
+
+        now = time.monotonic()
+        last = self._proc_sample
+        if last is not None and last[0] == pid and now - last[1] < self.PROC_STATS_INTERVAL:
+            return self._proc_stats
+
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                # 进程名可能含空格，从最后一个")"之后切分：utime/stime/rss 分别为第14/15/24列
+                fields = f.read().rsplit(")", 1)[1].split()
+            ticks = int(fields[11]) + int(fields[12])
+            rss_pages = int(fields[21])
+        except (OSError, ValueError, IndexError):
+            self._proc_sample = None
+            self._proc_stats = {"cpu_usage": 0.0, "memory_usage": 0.0}
+            return self._proc_stats
+
+        cpu_usage = 0.0
+        if last is not None and last[0] == pid and now > last[1]:
+            cpu_usage = (ticks - last[2]) / _CLK_TCK / (now - last[1]) * 100
+        self._proc_sample = (pid, now, ticks)
+        self._proc_stats = {
+            "cpu_usage": round(cpu_usage, 1),
+            "memory_usage": round(rss_pages * _PAGE_SIZE / (1024 * 1024), 1),
+        }
+        return self._proc_stats
+
     def get_status(self) -> Dict[str, Any]:
         """
         获取状态信息
@@ -1238,6 +1344,7 @@ class TraderProxy:
             "last_heartbeat": self.last_heartbeat.isoformat(),
             "restart_count": self.restart_count,
             "socket_path": self.socket_path,
+            **self._sample_proc_stats(),
         }
 
     async def ping(self) -> bool:
@@ -1271,6 +1378,7 @@ class TraderProxy:
             logger.error(f"TraderProxy [{self.account_id}] 未连接到Trader，无法刷新合约信息")
             return {"success": False, "message": "未连接到Trader"}
 
+        self._contracts_cache = None
         try:
             response = await self.socket_client.request("refresh_contracts", {}, timeout=30.0)
             return response or {"success": False, "message": "无响应"}
@@ -1282,7 +1390,7 @@ class TraderProxy:
         """
         获取合约列表
 
-        从 Trader 进程的内存中获取合约信息
+        从 Trader 进程的内存中获取合约信息，结果在 CONTRACTS_CACHE_TTL 内复用
 
         Returns:
             合约信息字典列表
@@ -1291,17 +1399,25 @@ class TraderProxy:
             logger.error(f"TraderProxy [{self.account_id}] 未连接到Trader，无法获取合约信息")
             return []
 
+        cache = self._contracts_cache
+        if cache is not None and time.monotonic() - cache[0] < self.CONTRACTS_CACHE_TTL:
+            return list(cache[1])
+
         try:
             response = await self.socket_client.request("get_contracts", {}, timeout=10.0)
             if response is None:
                 return []
-            # 如果返回的是列表，直接返回
-            if isinstance(response, list):
-                return response
             # 如果返回的是字典，包装成列表
+            contracts: List[Dict[str, Any]]
             if isinstance(response, dict):
-                return [response]
-            return []
+                contracts = [response]
+            elif isinstance(response, list):
+                contracts = response
+            else:
+                return []
+            if contracts:
+                self._contracts_cache = (time.monotonic(), tuple(contracts))
+            return contracts
         except Exception as e:
             logger.error(f"TraderProxy [{self.account_id}] 获取合约列表请求失败: {e}")
             return []
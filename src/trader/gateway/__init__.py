@@ -0,0 +1,36 @@
+"""
+交易网关
+
+GATEWAYS 登记网关类型与实现类，实现类按需导入（CTP 依赖可选的 CTP SDK）
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, Tuple, cast
+
+if TYPE_CHECKING:
+    from src.trader.gateway.base_gateway import BaseGateway
+
+# 网关类型 -> (模块路径, 类名)
+GATEWAYS: Dict[str, Tuple[str, str]] = {
+    "CTP": ("src.trader.gateway.ctp_gateway", "CtpGateway"),
+    "TQSDK": ("src.trader.gateway.tq_gateway", "TqGateway"),
+}
+
+# 未登记的类型使用默认网关
+DEFAULT_GATEWAY = "TQSDK"
+
+
+def create_gateway(gateway_type: str, config: Any) -> "BaseGateway":
+    """
+    按类型创建Gateway
+
+    Args:
+        gateway_type: 网关类型（CTP/TQSDK），未登记的类型使用 DEFAULT_GATEWAY
+        config: 账户配置
+
+    Returns:
+        Gateway实例
+    """
+    module_path, class_name = GATEWAYS.get(gateway_type) or GATEWAYS[DEFAULT_GATEWAY]
+    gateway_cls = getattr(importlib.import_module(module_path), class_name)
+    return cast("BaseGateway", gateway_cls(config))
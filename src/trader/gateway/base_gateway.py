@@ -6,7 +6,7 @@ Gateway适配器基类
 import re
 from abc import ABC, abstractmethod
 from datetime import date, datetime
-from typing import Dict, Optional, Union
+from typing import Dict, Iterator, Mapping, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -23,10 +23,13 @@ from src.models.object import (
     TickData,
     TradeData,
 )
-from src.utils.logger import get_logger
+from src.utils.logger import ErrorLogThrottle, get_logger
 
 logger = get_logger(__name__)
 
+# 事件队列丢弃告警间隔（每丢弃N个事件记录一次）
+DROPPED_EVENTS_LOG_INTERVAL = 100
+
 
 class BaseGateway(ABC):
     """
@@ -58,6 +61,14 @@ class BaseGateway(ABC):
         self.positions: Dict[str, PositionData] = {}
         # 开仓限制配置 {symbol: min_open_volume}
         self._open_limit: Optional[Dict[str, int]] = None
+        # 上次推送的账户数值签名，用于过滤无变化的账户推送
+        self._account_signature: Optional[Tuple] = None
+        # 事件队列已满时丢弃的事件数
+        self.dropped_events: int = 0
+        # 合约代码标准化结果缓存（只缓存能确定的结果，未识别的合约不缓存）
+        self._std_symbol_cache: Dict[str, str] = {}
+        # 高频路径（轮询、事件分发）的异常日志限流
+        self._error_log = ErrorLogThrottle()
         logger.info(f"{self.gateway_name} Gateway 初始化完成")
 
 
@@ -81,6 +92,32 @@ class BaseGateway(ABC):
                 contract.min_open_volume = min_volume
                 logger.debug(f"合约 {contract.symbol} 设置最小开仓手数: {min_volume}")
 
+    def _account_changed(self, account: AccountData) -> bool:
+        """
+        判断账户数据相对上次推送是否有变化（忽略更新时间等不影响资金的字段）
+
+        Args:
+            account: 待推送的账户数据
+
+        Returns:
+            bool: 资金或连接状态有变化返回True
+        """
+        signature = (
+            account.balance,
+            account.available,
+            account.frozen,
+            account.margin,
+            account.hold_profit,
+            account.close_profit,
+            account.float_profit,
+            account.md_connected,
+            account.td_connected,
+        )
+        if signature == self._account_signature:
+            return False
+        self._account_signature = signature
+        return True
+
     @property
     def connected(self) -> bool:
         """网关是否已连接（行情和交易都连接时为True）"""
@@ -102,7 +139,16 @@ class BaseGateway(ABC):
         """
         if not symbol:
             return None
-
+        cached = self._std_symbol_cache.get(symbol)
+        if cached is not None:
+            return cached
+        std_symbol = self._resolve_std_symbol(symbol)
+        if std_symbol is not None and (std_symbol in self.contracts or "." in symbol):
+            self._std_symbol_cache[symbol] = std_symbol
+        return std_symbol
+
+    def _resolve_std_symbol(self, symbol: str) -> Optional[str]:
+        """解析合约代码为标准格式（不使用缓存）"""
         symbol = symbol.strip()
 
         # 已经是标准格式 "symbol.exchange"
@@ -167,7 +213,7 @@ class BaseGateway(ABC):
 
                 loaded_count = 0
                 for po in contract_pos:
-                    symbol = po.symbol.split(".")[1] if "." in po.symbol else po.symbol  # type: ignore[union-attr]
+                    symbol = po.symbol.partition(".")[2] or po.symbol  # type: ignore[union-attr]
                     exchange = Exchange.from_str(po.exchange_id)  # type: ignore[arg-type]
                     if exchange == Exchange.NONE:
                         continue
@@ -240,6 +286,20 @@ class BaseGateway(ABC):
         """
         pass
 
+    def is_subscribing(self, symbol: str) -> bool:
+        """
+        合约行情是否仍在订阅中（已登记订阅但行情尚未就绪）
+
+        同步订阅的网关订阅返回即就绪，默认返回False
+
+        Args:
+            symbol: 合约代码
+
+        Returns:
+            bool: 行情订阅尚未完成返回True
+        """
+        return False
+
     @abstractmethod
     def subscribe_bars(self, symbol: str, interval: str) -> bool:
         """
@@ -293,35 +353,119 @@ class BaseGateway(ABC):
         pass
 
     @abstractmethod
-    def get_positions(self) -> dict[str, PositionData]:
+    def get_positions(self) -> Mapping[str, PositionData]:
         """
         查询持仓信息
 
         Returns:
-            dict[str,PositionData]: 持仓列表
+            Mapping[str,PositionData]: 持仓列表（只读）
         """
         pass
 
     @abstractmethod
-    def get_orders(self) -> dict[str, OrderData]:
+    def get_orders(self) -> Mapping[str, OrderData]:
         """
         查询活动订单
 
         Returns:
-            dict[str,OrderData]: 订单列表
+            Mapping[str,OrderData]: 订单列表（只读）
         """
         pass
 
     @abstractmethod
-    def get_trades(self) -> dict[str, TradeData]:
+    def get_trades(self) -> Mapping[str, TradeData]:
         """
         查询今日成交
 
         Returns:
-            dict[str,TradeData]: 成交列表
+            Mapping[str,TradeData]: 成交列表（只读）
         """
         pass
 
+    def get_position(self, symbol: str) -> Optional[PositionData]:
+        """
+        查询单个合约持仓（子类可覆盖以避免复制全部持仓）
+
+        Args:
+            symbol: 合约代码
+
+        Returns:
+            Optional[PositionData]: 持仓数据，不存在返回None
+        """
+        return self.get_positions().get(symbol)
+
+    def iter_positions(self) -> Iterator[PositionData]:
+        """
+        遍历持仓（子类可覆盖以避免构造持仓字典）
+
+        Returns:
+            Iterator[PositionData]: 持仓迭代器
+        """
+        return iter(self.get_positions().values())
+
+    def iter_orders(self) -> Iterator[OrderData]:
+        """
+        遍历订单（子类可覆盖以避免构造订单字典）
+
+        Returns:
+            Iterator[OrderData]: 订单迭代器
+        """
+        return iter(self.get_orders().values())
+
+    def iter_active_orders(self) -> Iterator[OrderData]:
+        """
+        遍历活动订单（子类可覆盖以跳过已完成订单的转换）
+
+        Returns:
+            Iterator[OrderData]: 活动订单迭代器
+        """
+        return (order for order in self.iter_orders() if order.is_active())
+
+    def iter_trades(self) -> Iterator[TradeData]:
+        """
+        遍历成交（子类可覆盖以避免构造成交字典）
+
+        Returns:
+            Iterator[TradeData]: 成交迭代器
+        """
+        return iter(self.get_trades().values())
+
+    def get_order(self, order_id: str) -> Optional[OrderData]:
+        """
+        查询单个订单（子类可覆盖以避免复制全部订单）
+
+        Args:
+            order_id: 订单ID
+
+        Returns:
+            Optional[OrderData]: 订单数据，不存在返回None
+        """
+        return self.get_orders().get(order_id)
+
+    def get_trade(self, trade_id: str) -> Optional[TradeData]:
+        """
+        查询单笔成交（子类可覆盖以避免复制全部成交）
+
+        Args:
+            trade_id: 成交ID
+
+        Returns:
+            Optional[TradeData]: 成交数据，不存在返回None
+        """
+        return self.get_trades().get(trade_id)
+
+    def get_contract(self, symbol: str) -> Optional[ContractData]:
+        """
+        查询单个合约信息（不复制合约字典）
+
+        Args:
+            symbol: 合约代码
+
+        Returns:
+            Optional[ContractData]: 合约数据，不存在返回None
+        """
+        return self.contracts.get(symbol)
+
     @abstractmethod
     def get_contracts(self) -> dict[str, ContractData]:
         """
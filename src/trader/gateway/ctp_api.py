@@ -46,7 +46,7 @@ from src.models.object import (
     TickData,
     TradeData,
 )
-from src.utils.logger import get_logger
+from src.utils.logger import ErrorLogThrottle, get_logger
 
 if TYPE_CHECKING:
     from src.trader.gateway.ctp_gateway import CtpGateway
@@ -114,21 +114,24 @@ PRODUCT_CTP2VT = {
 # CTP 常用常量
 MIN_VOLUME = 1
 
-error_msg = [
-            "拒绝",
-            "取消",
-            "不足",
-            "暂停",
-            "禁止",
-            "错误",
-            "闭市",
-            "未连接",
-            "最小单位",
-            "失败",
-            "不",
-            "超过",
-            "没有",
-]
+# 拒单状态消息（精确匹配，使用frozenset做O(1)查找）
+error_msg = frozenset(
+    {
+        "拒绝",
+        "取消",
+        "不足",
+        "暂停",
+        "禁止",
+        "错误",
+        "闭市",
+        "未连接",
+        "最小单位",
+        "失败",
+        "不",
+        "超过",
+        "没有",
+    }
+)
 
 
 def adjust_price(price: float, max_value: float = 1e308) -> float:
@@ -158,6 +161,9 @@ class CtpMdApi(mdapi.CThostFtdcMdSpi):
         # 请求 ID
         self.reqid = 0
 
+        # 行情回调异常日志限流
+        self._error_log = ErrorLogThrottle()
+
         # 已订阅合约
         self.subscribed: set = set()
         # 历史订阅合约
@@ -359,7 +365,7 @@ class CtpMdApi(mdapi.CThostFtdcMdSpi):
             self.gateway.on_tick(tick)
 
         except Exception as e:
-            logger.exception(f"处理行情数据异常: {e}")
+            self._error_log.exception(type(e), f"处理行情数据异常: {e}")
 
     def _get_temp_path(self, subdir: str) -> Path:
         """获取临时文件路径"""
@@ -795,7 +801,7 @@ class CtpTdApi(tdapi.CThostFtdcTraderSpi):
         order.update_time = datetime.now()
 
         # 订单完成后移除
-        if status in [OrderStatus.FINISHED, OrderStatus.REJECTED]:
+        if not order.is_active():
             self.order_map.pop(order_ref, None)
 
         self.gateway.on_order(order)
@@ -10,7 +10,8 @@ CTP Gateway 适配器（异步版本）
 
 import asyncio
 import queue
-from typing import Any, Dict, List, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -31,7 +32,7 @@ from src.models.object import (
     TickData,
     TradeData,
 )
-from src.trader.gateway.base_gateway import BaseGateway
+from src.trader.gateway.base_gateway import DROPPED_EVENTS_LOG_INTERVAL, BaseGateway
 
 # 从 ctp_api 导入 CTP API 封装类
 from src.trader.gateway.ctp_api import CtpMdApi, CtpTdApi
@@ -78,6 +79,10 @@ class CtpGateway(BaseGateway):
         # 缓存报单数据
         self._orders: Dict[str, OrderData] = {}
 
+        # 查询快照: 写入时递增版本号，查询时版本未变则复用只读快照，避免每次查询都复制
+        self._versions: Dict[str, int] = dict.fromkeys(("positions", "orders", "trades"), 0)
+        self._snapshots: Dict[str, Tuple[int, Mapping[str, Any]]] = {}
+
         # K线订阅列表: [(symbol, interval), ...]
         self._bar_subs: List[Tuple[str, str]] = []
 
@@ -116,6 +121,8 @@ class CtpGateway(BaseGateway):
             self._positions.clear()
             self._trades.clear()
             self._orders.clear()
+            for name in self._versions:
+                self._versions[name] += 1
 
             # 创建 API 实例
             self.md_api = CtpMdApi(self)
@@ -195,8 +202,7 @@ class CtpGateway(BaseGateway):
     def get_account(self) -> Optional[AccountData]:
         """获取账户数据"""
         if self._account:
-            self._account.hold_profit = sum(position.hold_profit for position in self._positions.values())
-            self._account.close_profit = sum(position.close_profit for position in self._positions.values())
+            self._account.hold_profit, self._account.close_profit = self._sum_position_profit()
             self._account.balance = self._account.static_balance + self._account.hold_profit + self._account.close_profit
             return self._account
 
@@ -214,17 +220,70 @@ class CtpGateway(BaseGateway):
         )
         return default_account
 
-    def get_positions(self) -> Dict[str, PositionData]:
-        """获取持仓数据"""
-        return self._positions.copy()
+    def _sum_position_profit(self) -> Tuple[float, float]:
+        """
+        单次遍历汇总持仓盈亏
 
-    def get_orders(self) -> Dict[str, OrderData]:
-        """获取订单数据"""
-        return self._orders.copy()
+        Returns:
+            (持仓盈亏, 平仓盈亏)
+        """
+        hold_profit = 0.0
+        close_profit = 0.0
+        for position in self._positions.values():
+            hold_profit += position.hold_profit_long + position.hold_profit_short
+            close_profit += position.close_profit_long + position.close_profit_short
+        return hold_profit, close_profit
+
+    def _snapshot(self, name: str, data: Dict[str, Any]) -> Mapping[str, Any]:
+        """
+        获取数据的只读快照，数据未变化时复用上次快照
 
-    def get_trades(self) -> Dict[str, TradeData]:
-        """获取成交数据"""
-        return self._trades.copy()
+        先读版本号再复制，回调线程在复制期间的写入会使版本号前进，下次查询时重建。
+        """
+        version = self._versions[name]
+        cached = self._snapshots.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        snapshot = MappingProxyType(data.copy())
+        self._snapshots[name] = (version, snapshot)
+        return snapshot
+
+    def get_positions(self) -> Mapping[str, PositionData]:
+        """获取持仓数据（只读快照）"""
+        return self._snapshot("positions", self._positions)
+
+    def get_orders(self) -> Mapping[str, OrderData]:
+        """获取订单数据（只读快照）"""
+        return self._snapshot("orders", self._orders)
+
+    def get_trades(self) -> Mapping[str, TradeData]:
+        """获取成交数据（只读快照）"""
+        return self._snapshot("trades", self._trades)
+
+    def get_position(self, symbol: str) -> Optional[PositionData]:
+        """获取单个合约持仓"""
+        return self._positions.get(symbol)
+
+    # 回调线程会并发修改字典，遍历前先对values取快照（不复制键）
+    def iter_positions(self) -> Iterator[PositionData]:
+        """遍历持仓数据"""
+        return iter(tuple(self._positions.values()))
+
+    def iter_orders(self) -> Iterator[OrderData]:
+        """遍历订单数据"""
+        return iter(tuple(self._orders.values()))
+
+    def iter_trades(self) -> Iterator[TradeData]:
+        """遍历成交数据"""
+        return iter(tuple(self._trades.values()))
+
+    def get_order(self, order_id: str) -> Optional[OrderData]:
+        """获取单个订单"""
+        return self._orders.get(order_id)
+
+    def get_trade(self, trade_id: str) -> Optional[TradeData]:
+        """获取单笔成交"""
+        return self._trades.get(trade_id)
 
     def get_contracts(self) -> Dict[str, ContractData]:
         """获取所有合约信息"""
@@ -349,10 +408,6 @@ class CtpGateway(BaseGateway):
         logger.info(f"订阅K线数据: {std_symbol} {interval}")
         return True
 
-    def get_contract(self, symbol: str) -> Optional[ContractData]:
-        """获取合约信息"""
-        return self.contracts.get(symbol)
-
     async def _event_dispatcher(self):
         """
         事件分发协程（在主线程事件循环中运行）
@@ -363,19 +418,23 @@ class CtpGateway(BaseGateway):
         """
         try:
             logger.info("事件分发协程已启动")
+            # 热路径上的属性查找提前绑定为局部变量
+            queue_get = self._sync_queue.get
+            engine_put = self._event_engine.put if self._event_engine else None
+            to_thread = asyncio.to_thread
             while self._running:
                 try:
                     # 从同步队列获取数据（超时1秒）
-                    event_type, data = await asyncio.to_thread(self._sync_queue.get, timeout=1.0)
-                    if self._event_engine:
-                        self._event_engine.put(event_type, data)
+                    event_type, data = await to_thread(queue_get, timeout=1.0)
+                    if engine_put:
+                        engine_put(event_type, data)
 
                 except queue.Empty:
                     # 队列为空或超时，继续循环
                     await asyncio.sleep(0)
                     continue
                 except Exception as e:
-                    logger.exception(f"事件分发异常: {e}")
+                    self._error_log.exception(type(e), f"事件分发异常: {e}")
 
             logger.info("事件分发协程已退出")
 
@@ -387,14 +446,17 @@ class CtpGateway(BaseGateway):
     def add_trade(self, trade: TradeData) -> None:
         """添加成交"""
         self._trades[trade.trade_id] = trade
+        self._versions["trades"] += 1
 
     def add_position(self, position: PositionData) -> None:
         """添加持仓"""
         self._positions[position.symbol] = position
+        self._versions["positions"] += 1
 
     def add_order(self, order: OrderData) -> None:
         """添加订单"""
         self._orders[order.order_id] = order
+        self._versions["orders"] += 1
 
     def add_contract(self, contract: ContractData) -> None:
         """添加合约"""
@@ -439,7 +501,7 @@ class CtpGateway(BaseGateway):
             contract = self.contracts.get(symbol)
             multiple = contract.multiple if contract and contract.multiple else 1
             position = PositionData.default(symbol, trade.exchange, multiple)
-            self._positions[symbol] = position
+            self.add_position(position)
         position.update_position(trade)
         # 推送更新后的持仓
         self._push_to_queue(EventTypes.POSITION_UPDATE, position)
@@ -448,15 +510,9 @@ class CtpGateway(BaseGateway):
         """处理账户回调"""
         # 缓存账户数据
         self._account = account
-        self._account.hold_profit = sum(
-            position.hold_profit_long + position.hold_profit_short
-            for position in self._positions.values()
-        )
-        self._account.close_profit = sum(
-            position.close_profit_long + position.close_profit_short
-            for position in self._positions.values()
-        )
-        self._push_to_queue(EventTypes.ACCOUNT_UPDATE, account)
+        self._account.hold_profit, self._account.close_profit = self._sum_position_profit()
+        if self._account_changed(account):
+            self._push_to_queue(EventTypes.ACCOUNT_UPDATE, account)
 
     def on_status(self) -> None:
         """处理状态回调"""
@@ -470,7 +526,8 @@ class CtpGateway(BaseGateway):
         if account:
             account.md_connected = self.md_connected
             account.td_connected = self.td_connected
-            self._push_to_queue(EventTypes.ACCOUNT_UPDATE, account)
+            if self._account_changed(account):
+                self._push_to_queue(EventTypes.ACCOUNT_UPDATE, account)
 
         if self.connected:
             # 订阅行情
@@ -489,7 +546,12 @@ class CtpGateway(BaseGateway):
         try:
             self._sync_queue.put_nowait((event_type, data))
         except queue.Full:
-            logger.warning(f"事件队列已满，丢弃事件: {event_type}")
+            # 队列满时丢弃新事件并计数，告警按丢弃次数限频
+            self.dropped_events += 1
+            if self.dropped_events % DROPPED_EVENTS_LOG_INTERVAL == 1:
+                logger.warning(
+                    f"事件队列已满，丢弃事件: {event_type}，累计丢弃 {self.dropped_events} 个"
+                )
 
     def _update_close_profit(self, trade: TradeData, position: PositionData, volume: int) -> None:
         """
@@ -11,9 +11,9 @@ import threading
 import time
 from contextlib import closing
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
-from pandas import DataFrame
+from pandas import DataFrame, Series
 from tqsdk import TqAccount, TqApi, TqAuth, TqCtp, TqKq, TqRohon, TqSim, data_extension
 from tqsdk.objs import Account, Order, Position, Quote, Trade
 
@@ -36,10 +36,11 @@ from src.models.object import (
     TradeData,
 )
 from src.models.po import ContractPo
-from src.trader.gateway.base_gateway import BaseGateway
+from src.trader.gateway.base_gateway import DROPPED_EVENTS_LOG_INTERVAL, BaseGateway
 from src.utils.async_event_engine import AsyncEventEngine
 from src.utils.config_loader import GatewayConfig,TraderConfig
 from src.utils.database import session_scope
+from src.utils.event_engine import EventTypes
 from src.utils.logger import get_logger
 
 ctx = get_app_context()
@@ -54,6 +55,67 @@ exchange_map = {
     "GFEX": Exchange.GFEX,
 }
 
+# Gateway事件类型 -> AsyncEventEngine事件类型
+_GATEWAY_EVENT_TYPES = {
+    "tick": EventTypes.TICK_UPDATE,
+    "bar": EventTypes.KLINE_UPDATE,
+    "order": EventTypes.ORDER_UPDATE,
+    "trade": EventTypes.TRADE_UPDATE,
+    "position": EventTypes.POSITION_UPDATE,
+    "account": EventTypes.ACCOUNT_UPDATE,
+    "contract": EventTypes.CONTRACT_UPDATE,
+}
+
+# 轮询等待超时（秒），决定断开连接时轮询线程的最长退出延迟
+POLL_TIMEOUT = 0.1
+
+# TqSdk买卖方向/开平标志 -> 枚举（避免转换时逐次调用Enum构造）
+DIRECTION_TQ2VT = {direction.value: direction for direction in Direction}
+OFFSET_TQ2VT = {offset.value: offset for offset in Offset}
+
+# 报单状态信息中出现以下关键字视为拒单
+_ORDER_REJECT_KEYWORDS = (
+    "拒绝",
+    "取消",
+    "不足",
+    "暂停",
+    "禁止",
+    "错误",
+    "闭市",
+    "未连接",
+    "最小单位",
+    "失败",
+    "不",
+    "超过",
+    "没有",
+)
+
+
+def _parse_quote_datetime(value: Any) -> datetime:
+    """
+    解析TqSdk行情时间
+
+    TqSdk行情时间为 "2017-07-26 23:04:21.000001" 格式字符串，直接按ISO格式解析；
+    兼容纳秒时间戳，无法解析时使用当前时间
+
+    Args:
+        value: 行情时间
+
+    Returns:
+        datetime: 行情时间
+    """
+    if isinstance(value, str):
+        if value:
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                pass
+        return datetime.now()
+    try:
+        return datetime.fromtimestamp(value / 1e9) if value else datetime.now()
+    except (TypeError, ValueError, OverflowError, OSError):
+        return datetime.now()
+
 
 class TqGateway(BaseGateway):
     """TqSdk Gateway适配器（纯异步实现）"""
@@ -77,18 +139,26 @@ class TqGateway(BaseGateway):
         self._positions: Dict[str, Position] = {}
         self._orders: Dict[str, Order] = {}
         self._trades: Dict[str, Trade] = {}
+        # 已转换的成交数据（成交生成后不再变化，只转换一次）
+        self._trade_cache: Dict[str, TradeData] = {}
+        # 已转换的完成订单（订单完成后不再变化，只转换一次）
+        self._finished_order_cache: Dict[str, OrderData] = {}
         self._quotes: Dict[str, Quote] = {}
         # 自定义换仓
         self._klines: Dict[str, DataFrame] = {}
         self._pending_orders: Dict[str, Order] = {}
         # 大写合约，key为原始symbol，value为exchange
         self._upper_symbols: Dict[str, str] = {}
+        # 行情合约拆分缓存，key为TqSdk合约(如SHFE.rb2510)，value为(合约代码, 交易所)
+        self._symbol_parts: Dict[str, Tuple[str, Exchange]] = {}
         # 合约信息，key为标准化后的symbol，value为ContractData
         # self.contracts: Dict[str, ContractData] = {}
 
         # 历史订阅的合约符号列表
         self.hist_subs: set[str] = set()
-        self.kline_subs: List[tuple[str, str]] = []
+        self.kline_subs: Set[tuple[str, str]] = set()
+        # 待订阅行情的合约，由轮询线程在下一轮wait_update前批量订阅
+        self._pending_subs: Set[str] = set()
 
         # 订单引用计数
         self._order_ref = 0
@@ -228,6 +298,8 @@ class TqGateway(BaseGateway):
             self._positions = self.api.get_position()
             self._orders = self.api.get_order()
             self._trades = self.api.get_trade()
+            self._trade_cache = {}
+            self._finished_order_cache = {}
 
             # 发送初始数据
             self.md_connected = True
@@ -251,9 +323,10 @@ class TqGateway(BaseGateway):
             # 初始化持仓合约的行情订阅
             pos_symbols = [symbol for symbol in self._positions if len(symbol) <= 12]
             self.subscribe(pos_symbols)
+            self._flush_subscriptions()
 
             # 订阅kline
-            for symbol, interval in self.kline_subs:
+            for symbol, interval in list(self.kline_subs):
                 self.subscribe_bars(symbol, interval)
 
             logger.info("TqSdk开始轮询...")
@@ -262,7 +335,9 @@ class TqGateway(BaseGateway):
                     break
 
                 try:
-                    has_data = self.api.wait_update(deadline=time.time() + 3)
+                    if self._pending_subs:
+                        self._flush_subscriptions()
+                    has_data = self.api.wait_update(deadline=time.time() + POLL_TIMEOUT)
 
                     if has_data:
                         self._collect_and_push_updates()
@@ -301,43 +376,99 @@ class TqGateway(BaseGateway):
         return trading_day.strftime("%Y%m%d")
 
     def subscribe(self, symbols: List[str]) -> bool:
-        """订阅行情"""
+        """
+        订阅行情
+
+        合约校验后登记为待订阅，行情请求由轮询线程在下一轮wait_update前合并发出，
+        返回时订阅尚未完成；未连接时只记录到历史订阅，连接后统一订阅
+
+        Returns:
+            bool: 合约均已登记订阅返回True，存在无合约信息的合约返回False
+        """
         try:
             # 添加到订阅列表中
             self.hist_subs.update(symbols)
             if not self.connected or not self.is_ready:
                 return True
 
-            std_symbols = [self.std_symbol(s) for s in symbols]
-            subscribe_symbols = [s for s in std_symbols if s and s not in self._quotes]
-            if len(subscribe_symbols) == 0:
-                logger.info(f"无合约需要订阅")
-                return True
-
-            for s in subscribe_symbols:
-                contract = self.contracts.get(s)
-                if not contract:
-                    logger.error(f"未获取到合约信息: {s}")
+            # 已订阅的合约直接跳过，其余标准化后去重（保持顺序）
+            quotes = self._quotes
+            contracts = self.contracts
+            subscribe_symbols: Dict[str, None] = {}
+            unknown_symbols: List[str] = []
+            for symbol in symbols:
+                if symbol in quotes:
                     continue
-                if self.api is None:
+                std_symbol = self.std_symbol(symbol)
+                if std_symbol in quotes:
                     continue
-                quote = self.api.get_quote(contract.exchange.value + "." + contract.symbol)
-                self._quotes[contract.symbol] = quote
-            logger.info(f"订阅行情: {subscribe_symbols}")
+                if std_symbol and std_symbol in contracts:
+                    subscribe_symbols[std_symbol] = None
+                else:
+                    unknown_symbols.append(symbol)
+
+            if unknown_symbols:
+                logger.error(f"未获取到合约信息: {unknown_symbols}")
+            if subscribe_symbols:
+                # 仅登记待订阅合约，由轮询线程合并为一次get_quote_list请求
+                self._pending_subs.update(subscribe_symbols)
+                logger.info(f"订阅行情: {list(subscribe_symbols)}")
+            elif not unknown_symbols:
+                logger.info(f"无合约需要订阅")
 
-            return True
+            return not unknown_symbols
         except Exception as e:
             logger.exception(f"订阅行情失败:{symbols} {e}")
             return False
 
+    def is_subscribing(self, symbol: str) -> bool:
+        """合约已登记待订阅、行情尚未由轮询线程取得时返回True"""
+        if not self._pending_subs:
+            return False
+        return self.std_symbol(symbol) in self._pending_subs
+
+    def _flush_subscriptions(self) -> None:
+        """
+        批量订阅待订阅合约的行情（仅在轮询线程中调用）
+
+        合约在行情取得后才移出待订阅集合，请求失败时保留，下一轮轮询重试
+        """
+        pending = self._pending_subs
+        contracts: List[ContractData] = []
+        for s in list(pending):
+            if s in self._quotes:
+                pending.discard(s)
+                continue
+            contract = self.contracts.get(s)
+            if not contract:
+                logger.error(f"未获取到合约信息: {s}")
+                pending.discard(s)
+                continue
+            contracts.append(contract)
+        if not contracts or self.api is None:
+            return
+
+        tq_symbols = [contract.exchange.value + "." + contract.symbol for contract in contracts]
+        try:
+            quotes = self.api.get_quote_list(tq_symbols)
+        except Exception as e:
+            # 待订阅合约保留在集合中，下一轮轮询重试
+            self._error_log.exception(("subscribe", type(e)), f"批量订阅行情失败:{tq_symbols} {e}")
+            return
+        for contract, tq_symbol, quote in zip(contracts, tq_symbols, quotes):
+            self._quotes[contract.symbol] = quote
+            # 订阅时即登记合约拆分结果，行情转换时无需再解析交易所
+            self._symbol_parts[tq_symbol] = (contract.symbol, contract.exchange)
+        # 行情登记完成后再移出，is_subscribing不会出现既不在待订阅也无行情的间隙
+        pending.difference_update(contract.symbol for contract in contracts)
+
     def subscribe_bars(self, symbol: str, interval: str) -> bool:
         """订阅K线数据"""
         std_symbol = self.std_symbol(symbol)
         if std_symbol is None:
             logger.error(f"无法识别合约代码: {symbol}")
             return False
-        if (std_symbol, interval) not in self.kline_subs:
-            self.kline_subs.append((std_symbol, interval))
+        self.kline_subs.add((std_symbol, interval))
 
         if not self.connected:
             return False
@@ -453,23 +584,27 @@ class TqGateway(BaseGateway):
 
             contracts_to_save = []
 
-            for index, item in symbol_infos.iterrows():
-                symbol = (
-                    item.instrument_id.split(".")[1]
-                    if "." in item.instrument_id
-                    else item.instrument_id
-                )
-                if item.exchange_id not in exchange_map:
-                    continue
+            # 先按交易所过滤，再按列整体取出为Python列表后逐行组合（不为每行构造Series或numpy标量）
+            symbol_infos = symbol_infos[symbol_infos["exchange_id"].isin(list(exchange_map))]
+            columns = [
+                "instrument_id",
+                "exchange_id",
+                "instrument_name",
+                "volume_multiple",
+                "price_tick",
+            ]
+            rows = zip(*(symbol_infos[column].tolist() for column in columns))
+            for instrument_id, exchange_id, instrument_name, volume_multiple, price_tick in rows:
+                symbol = instrument_id.partition(".")[2] or instrument_id
+                exchange = exchange_map[exchange_id]
 
-                exchange = exchange_map[item.exchange_id]
                 contract = ContractData(
                     symbol=symbol,
                     exchange=exchange,
-                    name=item.instrument_name,
+                    name=instrument_name,
                     product_type=ProductType.FUTURES,
-                    multiple=item.volume_multiple,
-                    pricetick=item.price_tick,
+                    multiple=volume_multiple,
+                    pricetick=price_tick,
                     min_volume=1,
                 )  # type: ignore[call-arg]
                 # 应用开仓限制配置
@@ -480,11 +615,11 @@ class TqGateway(BaseGateway):
                 # 准备保存到数据库的数据
                 contract_po = ContractPo(
                     symbol=symbol,
-                    exchange_id=item.exchange_id,
-                    instrument_name=item.instrument_name,
+                    exchange_id=exchange_id,
+                    instrument_name=instrument_name,
                     product_type="FUTURES",
-                    volume_multiple=item.volume_multiple,
-                    price_tick=item.price_tick,
+                    volume_multiple=volume_multiple,
+                    price_tick=price_tick,
                     min_volume=1,
                     option_strike=None,
                     option_underlying=None,
@@ -553,20 +688,83 @@ class TqGateway(BaseGateway):
 
     def get_positions(self) -> Dict[str, PositionData]:
         """获取持仓数据(兼容,返回原始格式)"""
-        data={}
-        for item in self._positions.values():
+        return {position.symbol: position for position in self.iter_positions()}
+
+    def iter_positions(self) -> Iterator[PositionData]:
+        """逐个转换并遍历持仓数据"""
+        for item in list(self._positions.values()):
             position = self._convert_position(item)
             if len(position.symbol) <= 6:
-                data[position.symbol] = position
-        return data
+                yield position
+
+    def get_position(self, symbol: str) -> Optional[PositionData]:
+        """获取单个合约持仓（仅转换目标持仓）"""
+        if len(symbol) > 6:
+            return None
+        # TqSdk持仓以"交易所.合约"为key，有合约信息时直接按key查找
+        contract = self.contracts.get(symbol)
+        if contract is not None:
+            item = self._positions.get(f"{contract.exchange.value}.{contract.symbol}")
+            return self._convert_position(item) if item is not None else None
+        for item in list(self._positions.values()):
+            if item.instrument_id == symbol:
+                return self._convert_position(item)
+        return None
 
     def get_orders(self) -> Dict[str, OrderData]:
         """获取订单数据(兼容,返回原始格式)"""
-        return {order_id: self._convert_order(order) for order_id, order in self._orders.items()}
+        return {order_id: self._get_order_data(order) for order_id, order in self._orders.items()}
+
+    def iter_orders(self) -> Iterator[OrderData]:
+        """逐个转换并遍历订单数据"""
+        for order in list(self._orders.values()):
+            yield self._get_order_data(order)
+
+    def iter_active_orders(self) -> Iterator[OrderData]:
+        """遍历活动订单，已完成的订单按TqSdk原始状态直接跳过，不做转换"""
+        for order in list(self._orders.values()):
+            if order.status == "ALIVE":
+                order_data = self._convert_order(order)
+                if order_data.is_active():
+                    yield order_data
 
     def get_trades(self) -> Dict[str, TradeData]:
-        """获取成交数据(兼容,返回原始格式)"""
-        return {trade_id: self._convert_trade(trade) for trade_id, trade in self._trades.items()}
+        """获取成交数据(兼容,返回原始格式)，仅转换新增成交"""
+        cache = self._trade_cache
+        trades = {}
+        for trade_id, trade in list(self._trades.items()):
+            trade_data = cache.get(trade_id)
+            if trade_data is None:
+                trade_data = cache[trade_id] = self._convert_trade(trade)
+            trades[trade_id] = trade_data
+        # 换日后成交列表重置，丢弃过期缓存
+        if len(cache) > len(trades):
+            self._trade_cache = dict(trades)
+        return trades
+
+    def get_order(self, order_id: str) -> Optional[OrderData]:
+        """获取单个订单（仅转换目标订单）"""
+        order = self._orders.get(order_id)
+        return self._get_order_data(order) if order is not None else None
+
+    def _get_order_data(self, order: Order) -> OrderData:
+        """转换订单数据，完成订单复用缓存的转换结果"""
+        order_data = self._finished_order_cache.get(order.order_id)
+        if order_data is None:
+            order_data = self._convert_order(order)
+            if order.status == "FINISHED":
+                self._finished_order_cache[order.order_id] = order_data
+        return order_data
+
+    def get_trade(self, trade_id: str) -> Optional[TradeData]:
+        """获取单笔成交（仅转换目标成交）"""
+        trade = self._trades.get(trade_id)
+        if trade is None:
+            return None
+        trade_data = self._trade_cache.get(trade_id)
+        if trade_data is None:
+            trade_data = self._trade_cache[trade_id] = self._convert_trade(trade)
+        return trade_data
 
     def get_quotes(self) -> Dict[str, TickData]:
         """获取行情数据(兼容,返回原始格式)"""
@@ -627,72 +825,59 @@ class TqGateway(BaseGateway):
     def _convert_position(self, pos: Position) -> PositionData:
         """转换持仓数据"""
         contract = self.contracts.get(pos.instrument_id)
-        position =  PositionData(
+        position = PositionData(
             symbol=pos.instrument_id,
-            exchange=self._parse_exchange(pos.exchange_id),
+            exchange=contract.exchange if contract else self._parse_exchange(pos.exchange_id),
             multiple=contract.multiple if contract else 0,
             pos_long_yd=int(pos.pos_long_his),
             pos_long_td=int(pos.pos_long_today),
             pos_short_yd=int(pos.pos_short_his),
             pos_short_td=int(pos.pos_short_today),
-            hold_price_long=float(pos.position_price_long) or 0,
-            hold_price_short=float(pos.position_price_short) or 0,
-            hold_profit_long=float(pos.position_profit_long) or 0,
-            hold_profit_short=float(pos.position_profit_short) or 0,
+            hold_price_long=float(pos.position_price_long),
+            hold_price_short=float(pos.position_price_short),
+            hold_profit_long=float(pos.position_profit_long),
+            hold_profit_short=float(pos.position_profit_short),
             close_profit_long=0,
             close_profit_short=0,
-            margin_long=float(pos.margin_long) or 0,
-            margin_short=float(pos.margin_short) or 0,
+            margin_long=float(pos.margin_long),
+            margin_short=float(pos.margin_short),
             auto_updated=True
         )
-        if position.symbol in self._quotes:
-            position.last_price = self._quotes[position.symbol].last_price or 0
+        quote = self._quotes.get(position.symbol)
+        if quote is not None:
+            position.last_price = quote.last_price or 0
         return position
 
     def _convert_order(self, order: Order) -> OrderData:
         """转换订单数据"""
         # 判断订单状态
-        error_msg = [
-            "拒绝",
-            "取消",
-            "不足",
-            "暂停",
-            "禁止",
-            "错误",
-            "闭市",
-            "未连接",
-            "最小单位",
-            "失败",
-            "不",
-            "超过",
-            "没有",
-        ]
-        status_msg = order.get("last_msg", "")
+        status_msg = order.last_msg
         status = OrderStatus.PENDING
-        if any(keyword in status_msg for keyword in error_msg):
+        if any(keyword in status_msg for keyword in _ORDER_REJECT_KEYWORDS):
             status = OrderStatus.REJECTED
         elif order.status == "FINISHED":
             status = OrderStatus.FINISHED
 
+        volume = int(order.volume_orign)
+        limit_price = order.limit_price
+        insert_date_time = order.insert_date_time
         data = OrderData(
             account_id=self.account_id or "",
             order_id=order.order_id,
             symbol=order.instrument_id,
             exchange=self._parse_exchange(order.exchange_id),
-            direction=Direction(order.get("direction", "BUY")),
-            offset=Offset(order.get("offset", "OPEN")),
-            volume=int(order.volume_orign),
-            traded=int(order.volume_orign) - int(order.volume_left),
+            direction=DIRECTION_TQ2VT[order.direction],
+            offset=OFFSET_TQ2VT[order.offset],
+            volume=volume,
+            traded=volume - int(order.volume_left),
             traded_price=float(order.trade_price) or 0,
-            price=order.limit_price or 0,
-            price_type=OrderType.LIMIT if order.limit_price else OrderType.MARKET,
+            price=limit_price or 0,
+            price_type=OrderType.LIMIT if limit_price else OrderType.MARKET,
             status=status,
             status_msg=status_msg,
-            gateway_order_id=order.get("exchange_order_id", ""),
+            gateway_order_id=order.exchange_order_id,
             insert_time=(
-                datetime.fromtimestamp(order.get("insert_date_time", 0) / 1e9)
-                if order.get("insert_date_time")
-                else None
+                datetime.fromtimestamp(insert_date_time / 1e9) if insert_date_time else None
             ),
             update_time=datetime.now(),
             trading_day=self.trading_day,
@@ -701,56 +886,44 @@ class TqGateway(BaseGateway):
 
     def _convert_trade(self, trade: Trade) -> TradeData:
         """转换成交数据"""
-        order_id = trade.get("order_id", "")
-        exchange_id = trade.get("exchange_id", "")
-        instrument_id = trade.get("instrument_id", "")
+        trade_date_time = trade.trade_date_time
 
         return TradeData(
             account_id=self.account_id or "",
-            trade_id=trade.get("trade_id", ""),
-            order_id=order_id,
-            symbol=instrument_id,
-            exchange=self._parse_exchange(exchange_id),
-            direction=Direction(trade.get("direction", "BUY")),
-            offset=Offset(trade.get("offset", "OPEN")),
-            price=float(trade.get("price", 0)),
-            volume=int(trade.get("volume", 0)),
-            trade_time=(
-                datetime.fromtimestamp(trade.get("trade_date_time", 0) / 1e9)
-                if trade.get("trade_date_time")
-                else None
-            ),
+            trade_id=trade.trade_id,
+            order_id=trade.order_id,
+            symbol=trade.instrument_id,
+            exchange=self._parse_exchange(trade.exchange_id),
+            direction=DIRECTION_TQ2VT[trade.direction],
+            offset=OFFSET_TQ2VT[trade.offset],
+            price=float(trade.price),
+            volume=int(trade.volume),
+            trade_time=datetime.fromtimestamp(trade_date_time / 1e9) if trade_date_time else None,
             trading_day=self.trading_day,
             commission=0,
         )
 
     def _convert_tick(self, quote: Quote) -> TickData:
-        """转换tick数据"""
-        exchange_id = quote.get("exchange_id", "")
-        instrument_id = quote.get("instrument_id", "")
-        try:
-            datetime_obj = int(float(str(quote.get("datetime", 0)).strip()))
-        except (ValueError, TypeError):
-            datetime_obj = 0
-
+        """转换tick数据（行情字段直接按属性读取，合约拆分结果按合约缓存）"""
+        symbol, exchange = self._get_symbol_parts(quote.instrument_id)
         return TickData(
-            symbol=instrument_id.split(".")[1],
-            exchange=self._parse_exchange(exchange_id),
-            datetime=datetime.fromtimestamp(datetime_obj / 1e9) if datetime_obj else datetime.now(),
-            last_price=float(quote.get("last_price", 0)),
-            volume=float(quote.get("volume", 0)),
-            turnover=float(quote.get("turnover", 0)),
-            open_interest=float(quote.get("open_interest", 0)),
-            bid_price1=float(quote.get("bid_price1", 0)),
-            ask_price1=float(quote.get("ask_price1", 0)),
-            bid_volume1=float(quote.get("bid_volume1", 0)),
-            ask_volume1=float(quote.get("ask_volume1", 0)),
-            open_price=float(quote.get("open", 0)),
-            high_price=float(quote.get("highest", 0)),
-            low_price=float(quote.get("lowest", 0)),
-            pre_close=float(quote.get("pre_open_interest", 0)),
-            limit_up=float(quote.get("upper_limit", 0)),
-            limit_down=float(quote.get("lower_limit", 0)),
+            symbol=symbol,
+            exchange=exchange,
+            datetime=_parse_quote_datetime(quote.datetime),
+            last_price=float(quote.last_price),
+            volume=float(quote.volume),
+            turnover=float(quote.amount),
+            open_interest=float(quote.open_interest),
+            bid_price1=float(quote.bid_price1),
+            ask_price1=float(quote.ask_price1),
+            bid_volume1=float(quote.bid_volume1),
+            ask_volume1=float(quote.ask_volume1),
+            open_price=float(quote.open),
+            high_price=float(quote.highest),
+            low_price=float(quote.lowest),
+            pre_close=float(quote.pre_open_interest),
+            limit_up=float(quote.upper_limit),
+            limit_down=float(quote.lower_limit),
         )  # type: ignore[call-arg]
 
     def _convert_bar(self, symbol: str, interval: str, data, update: Union[int, float]) -> BarData:
@@ -760,17 +933,19 @@ class TqGateway(BaseGateway):
         Args:
             update: K线更新时间（纳秒时间戳，TqSdk格式）
         """
+        # K线行先转为dict再取字段，避免逐个字段走Series索引
+        row = data.to_dict() if isinstance(data, Series) else data
         bar = BarData(
             symbol=symbol,
             interval=interval,
-            datetime=datetime.fromtimestamp(data["datetime"] / 1e9),
-            open_price=float(data["open"]),
-            high_price=float(data["high"]),
-            low_price=float(data["low"]),
-            close_price=float(data["close"]),
-            volume=float(data["volume"]),
-            turnover=float(data.get("turnover", 0)),
-            open_interest=float(data.get("open_interest", 0)),
+            datetime=datetime.fromtimestamp(row["datetime"] / 1e9),
+            open_price=float(row["open"]),
+            high_price=float(row["high"]),
+            low_price=float(row["low"]),
+            close_price=float(row["close"]),
+            volume=float(row["volume"]),
+            turnover=float(row.get("turnover", 0)),
+            open_interest=float(row.get("open_interest", 0)),
             update_time=datetime.fromtimestamp(update / 1e9),
         )
         # logger.info(f"收到新Bar: {data}")
@@ -781,65 +956,135 @@ class TqGateway(BaseGateway):
         try:
             if self.api is None:
                 return
+            is_changing = self.api.is_changing
             # 检查订单变化(只需检查挂单)
             to_delete = []
-            for order in list(self._pending_orders.values()):
-                if self.api.is_changing(order):
-                    order_data = self._convert_order(order)
-                    self._push_order(order_data)
+            if self._pending_orders:
+                changed_orders = self._changed_keys(getattr(self._orders, "_path", None))
+                if changed_orders is None:
+                    orders = [o for o in list(self._pending_orders.values()) if is_changing(o)]
+                else:
+                    orders = [
+                        self._pending_orders[order_id]
+                        for order_id in changed_orders
+                        if order_id in self._pending_orders
+                    ]
+                for order in orders:
+                    self._push_order(self._convert_order(order))
                     if order.status == "FINISHED":
                         to_delete.append(order.order_id)
             for order_id in to_delete:
                 self._pending_orders.pop(order_id, None)
 
             # 检查成交变化
-            if self.api.is_changing(self._trades):
-                for trade in self._trades.values():
-                    if self.api.is_changing(trade):
-                        trade_data = self._convert_trade(trade)
-                        self._push_trade(trade_data)
+            if is_changing(self._trades):
+                changed_trades = self._changed_keys(getattr(self._trades, "_path", None))
+                if changed_trades is None:
+                    trades = [t for t in self._trades.values() if is_changing(t)]
+                else:
+                    trades = [
+                        self._trades[trade_id]
+                        for trade_id in changed_trades
+                        if trade_id in self._trades
+                    ]
+                for trade in trades:
+                    self._push_trade(self._convert_trade(trade))
 
             # 检查持仓变化
-            if self.api.is_changing(self._positions):
-                for position in self._positions.values():
-                    if self.api.is_changing(position, ["pos_long", "pos_short"]):
-                        position_data = self._convert_position(position)
-                        self._push_position(position_data)
+            if is_changing(self._positions):
+                changed_positions = self._changed_keys(getattr(self._positions, "_path", None))
+                if changed_positions is None:
+                    positions = list(self._positions.values())
+                else:
+                    positions = [
+                        self._positions[key] for key in changed_positions if key in self._positions
+                    ]
+                for position in positions:
+                    if is_changing(position, ["pos_long", "pos_short"]):
+                        self._push_position(self._convert_position(position))
 
             # 检查账户变化
             # if self.api.is_changing(self._account):
             #    account_data = self._convert_account(self._account)
             #    self._push_account(account_data)
 
-            # 检查行情变化
-            for quote in self._quotes.values():
-                if self.api.is_changing(quote):
-                    tick_data = self._convert_tick(quote)
-                    self._push_tick(tick_data)
+            # 检查行情变化（本轮变化的行情合并为一个队列元素，减少跨线程取队列次数）
+            convert_tick = self._convert_tick
+            changed_symbols = self._changed_keys(["quotes"])
+            if changed_symbols is None:
+                ticks = [
+                    convert_tick(quote) for quote in self._quotes.values() if is_changing(quote)
+                ]
+            elif changed_symbols:
+                ticks = [
+                    convert_tick(quote)
+                    for quote in self._quotes.values()
+                    if quote.instrument_id in changed_symbols
+                ]
+            else:
+                ticks = []
+            if ticks:
+                self._push_ticks(ticks)
 
             # 检查K线变化
-            for key, kline in self._klines.items():
-                symbol, interval = key[0], key[1]
-                if self.api.is_changing(kline.iloc[-1], "datetime"):
-                    bar_data = self._convert_bar(
-                        symbol, interval, kline.iloc[-2], kline.iloc[-1]["datetime"]
-                    )
-                    self._push_bar(bar_data)
+            convert_bar = self._convert_bar
+            push_bar = self._push_bar
+            for (symbol, interval), kline in self._klines.items():
+                last_bar = kline.iloc[-1]
+                if is_changing(last_bar, "datetime"):
+                    push_bar(convert_bar(symbol, interval, kline.iloc[-2], last_bar["datetime"]))
 
         except Exception as e:
-            logger.exception(f"收集数据变化异常: {e}")
+            self._error_log.exception(type(e), f"收集数据变化异常: {e}")
+
+    def _changed_keys(self, path: Optional[List[str]]) -> Optional[Dict[str, None]]:
+        """
+        汇总本轮wait_update中指定数据路径下有更新的key
+
+        一次遍历本轮diff得到全部变化的key，代替对每个对象逐个调用is_changing（每次调用都会遍历diff）
+
+        Args:
+            path: TqSdk数据路径，如 ["quotes"] 或成交/持仓/委托对象的 _path
+
+        Returns:
+            Optional[Dict[str, None]]: 有更新的key（按出现顺序），无法获取本轮diff时返回None
+        """
+        # 注意：_sync_diffs与对象的_path均为TqSdk私有API，按tqsdk 3.10.x核对与is_changing
+        # 读取同一份diff，升级tqsdk时需重新核对；属性不存在时返回None，调用方退回is_changing判断
+        diffs = getattr(self.api, "_sync_diffs", None)
+        if not isinstance(diffs, list) or not isinstance(path, list):
+            return None
+        changed: Dict[str, None] = {}
+        for diff in diffs:
+            node = diff
+            for key in path:
+                node = node.get(key) if isinstance(node, dict) else None
+                if not node:
+                    break
+            if isinstance(node, dict):
+                changed.update(dict.fromkeys(node))
+        return changed
 
     def _push_to_queue(self, event_type: str, data: Any):
         """推送数据到同步队列（非阻塞）"""
         try:
             self._sync_queue.put_nowait((event_type, data))
         except queue.Full:
-            logger.warning(f"事件队列已满，丢弃事件: {event_type}")
+            # 队列满时丢弃新事件并计数，告警按丢弃次数限频
+            self.dropped_events += 1
+            if self.dropped_events % DROPPED_EVENTS_LOG_INTERVAL == 1:
+                logger.warning(
+                    f"事件队列已满，丢弃事件: {event_type}，累计丢弃 {self.dropped_events} 个"
+                )
 
     def _push_tick(self, tick_data: TickData):
         """推送Tick数据到同步队列（非阻塞）"""
         self._push_to_queue("tick", tick_data)
 
+    def _push_ticks(self, ticks: List[TickData]):
+        """批量推送本轮变化的Tick数据到同步队列（非阻塞）"""
+        self._push_to_queue("ticks", ticks)
+
     def _push_bar(self, bar_data: BarData):
         """推送Bar数据到同步队列（非阻塞）"""
         self._push_to_queue("bar", bar_data)
@@ -854,8 +1099,9 @@ class TqGateway(BaseGateway):
         self._push_to_queue("position", position_data)
 
     def _push_account(self, account_data: AccountData):
-        """推送Account数据到同步队列（非阻塞）"""
-        self._push_to_queue("account", account_data)
+        """推送Account数据到同步队列（非阻塞），资金和连接状态无变化时不推送"""
+        if self._account_changed(account_data):
+            self._push_to_queue("account", account_data)
 
     def _push_order(self, order_data: OrderData):
         """推送Order数据到同步队列（非阻塞）"""
@@ -877,24 +1123,37 @@ class TqGateway(BaseGateway):
         """
         try:
             logger.info("事件分发协程已启动")
+            # 热路径上的属性查找提前绑定为局部变量
+            sync_queue = self._sync_queue
+            queue_get = sync_queue.get
+            map_event_type = _GATEWAY_EVENT_TYPES.get
+            tick_event_type = _GATEWAY_EVENT_TYPES["tick"]
+            engine_put = self._event_engine.put if self._event_engine else None
+            to_thread = asyncio.to_thread
 
             while self._running:
                 try:
                     # 从同步队列获取数据（超时1秒）
-                    if self._sync_queue.empty():
+                    if sync_queue.empty():
                         await asyncio.sleep(0)
                         continue
-                    event_type, data = await asyncio.to_thread(self._sync_queue.get, timeout=1.0)
+                    event_type, data = await to_thread(queue_get, timeout=1.0)
+                    # 批量Tick逐个投递到AsyncEventEngine
+                    if event_type == "ticks":
+                        if engine_put:
+                            for tick in data:
+                                engine_put(tick_event_type, tick)
+                        continue
                     # 映射到AsyncEventEngine事件类型
-                    engine_event_type = self._map_event_type(event_type)
+                    engine_event_type = map_event_type(event_type)
                     # 直接推送到AsyncEventEngine
-                    if self._event_engine and engine_event_type:
-                        self._event_engine.put(engine_event_type, data)
+                    if engine_put and engine_event_type:
+                        engine_put(engine_event_type, data)
 
                 except asyncio.TimeoutError:
                     continue
                 except Exception as e:
-                    logger.exception(f"事件分发异常: {e}")
+                    self._error_log.exception(type(e), f"事件分发异常: {e}")
 
             logger.info("事件分发协程已退出")
 
@@ -905,19 +1164,27 @@ class TqGateway(BaseGateway):
 
     def _map_event_type(self, gateway_event: str) -> Optional[str]:
         """映射Gateway事件类型到AsyncEventEngine事件类型"""
-        from src.utils.event_engine import EventTypes
-
-        mapping = {
-            "tick": EventTypes.TICK_UPDATE,
-            "bar": EventTypes.KLINE_UPDATE,
-            "order": EventTypes.ORDER_UPDATE,
-            "trade": EventTypes.TRADE_UPDATE,
-            "position": EventTypes.POSITION_UPDATE,
-            "account": EventTypes.ACCOUNT_UPDATE,
-            "contract": EventTypes.CONTRACT_UPDATE,
-        }
-        return mapping.get(gateway_event)
+        return _GATEWAY_EVENT_TYPES.get(gateway_event)
+
+    def _get_symbol_parts(self, tq_symbol: str) -> Tuple[str, Exchange]:
+        """
+        拆分TqSdk合约代码，结果按合约缓存
+
+        Args:
+            tq_symbol: TqSdk合约代码，如 SHFE.rb2510
+
+        Returns:
+            Tuple[str, Exchange]: (合约代码, 交易所)
+        """
+        parts = self._symbol_parts.get(tq_symbol)
+        if parts is None:
+            exchange_id, _, symbol = tq_symbol.partition(".")
+            parts = self._symbol_parts[tq_symbol] = (symbol, self._parse_exchange(exchange_id))
+        return parts
 
     def _parse_exchange(self, exchange_code: str) -> Exchange:
-        """解析交易所代码"""
-        return exchange_map.get(exchange_code.upper(), Exchange.NONE)
+        """解析交易所代码（TqSdk交易所代码本身为大写，先直接查找）"""
+        exchange = exchange_map.get(exchange_code)
+        if exchange is None:
+            exchange = exchange_map.get(exchange_code.upper(), Exchange.NONE)
+        return exchange
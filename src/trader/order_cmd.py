@@ -47,7 +47,7 @@ class SplitStrategyType(str):
     DYNAMIC = "DYNAMIC"  # 动态拆单策略
 
 
-@dataclass
+@dataclass(slots=True)
 class SplitOrder:
     """拆单后的单个订单"""
 
@@ -56,7 +56,7 @@ class SplitOrder:
     offset: Optional[Offset] = None  # 开平类型（平仓策略使用）
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveOrderInfo:
     """活动订单信息"""
 
@@ -366,7 +366,7 @@ class OrderCmd:
         if not self._pending_order or order.order_id != self._pending_order.order_id:
             return
 
-        if order.status not in [OrderStatus.FINISHED, OrderStatus.REJECTED]:
+        if order.is_active():
             # 未完结报单不处理
             return
 
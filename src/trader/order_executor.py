@@ -245,6 +245,9 @@ class OrderCmdExecutor:
         Args:
             cmd: OrderCmd 实例
         """
+        # 行情订阅尚未完成时暂不触发，避免市价单因无行情被拒并消耗重试次数
+        if self._trading_engine.is_subscribing(cmd.symbol):
+            return
         # 获取待下单请求（传递持仓信息）
         req = cmd.trig()
         if not req:
@@ -251,7 +251,6 @@ class BaseStrategy:
             PositionData: 持仓对象
         """
         if symbol not in self._positions:
-            from src.models.object import Exchange
             contract = self.trading_engine.get_contract(symbol)
             if not contract:
                 logger.error(f"策略 [{self.strategy_id}] 未找到合约信息: {symbol}")
@@ -419,17 +419,16 @@ class StrategyManager:
         Returns:
             PositionData: 持仓数据，如果不存在则返回None
         """
-        from src.models.object import PositionData
-
-        if self.trading_engine and self.trading_engine.positions:
-            # 先直接用 symbol 查找
-            pos = self.trading_engine.positions.get(symbol)
-            if pos:
-                return pos
-            # 如果没找到，尝试遍历所有持仓（可能 symbol 格式不一致）
-            for p in self.trading_engine.positions.values():
-                if p.symbol == symbol:
-                    return p
+        if not self.trading_engine:
+            return None
+        # 先直接用 symbol 查找，Gateway只需取出/转换目标持仓
+        pos = self.trading_engine.get_position(symbol)
+        if pos:
+            return pos
+        # 如果没找到，尝试遍历所有持仓（可能 symbol 格式不一致）
+        for p in self.trading_engine.iter_positions():
+            if p.symbol == symbol:
+                return p
         return None
 
     # ==================== 策略持仓管理 ====================
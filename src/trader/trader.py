@@ -10,8 +10,10 @@ from typing import Any, Callable, Dict, Optional
 from datetime import datetime
 
 from src.app_context import AppContext, get_app_context
+from src.models.object import Direction, Offset
 from src.trader.alarm_handler import TraderAlarmHandler
 from src.trader.job_mgr import JobManager
+from src.trader.order_cmd import OrderCmd
 from src.trader.strategy import BaseParam, BaseStrategy
 from src.trader.strategy_manager import StrategyManager
 from src.trader.switch_mgr import SwitchPosManager
@@ -91,12 +93,12 @@ class Trader:
         # 初始化数据库（检查并创建）
         await self._init_database()
 
-        # 注册事件处理器
-        self._register_event_handlers()
-
         # 启动Socket服务器
         self.socket_server = SocketServer(self._socket_path, self.account_id)
         self.socket_server.register_handlers_from_instance(self)
+
+        # 注册事件处理器（依赖socket_server）
+        self._register_event_handlers()
         self._server_task = asyncio.create_task(self.socket_server.start())
         await asyncio.sleep(0.2)
         logger.info(f"Trader [{self.account_id}] SocketServer已启动，继续初始化...")
@@ -292,47 +294,53 @@ class Trader:
         except asyncio.CancelledError:
             logger.info(f"Trader [{self.account_id}] 服务器任务已取消")
 
-    async def _on_account_update(self, data):
-        """账户更新事件处理器"""
-        if self.socket_server:
-            await self.socket_server.send_push("account", data.model_dump())
-        else:
-            logger.info(f"账户更新: {data}")
+    async def _push(self, push_type: str, data: Any) -> None:
+        """
+        推送事件数据到Manager
+
+        SocketServer在推送时查找，重建后推送到新的SocketServer；字典数据（如账户状态）直接推送
+
+        Args:
+            push_type: 推送类型（account/order/trade/position/tick）
+            data: 事件数据
+        """
+        socket_server = self.socket_server
+        if socket_server:
+            await socket_server.send_push(
+                push_type, data if isinstance(data, dict) else data.model_dump()
+            )
 
-    async def _on_order_update(self, data):
+    async def _on_account_update(self, data: Any) -> None:
+        """账户更新/账户状态事件处理器"""
+        await self._push("account", data)
+
+    async def _on_order_update(self, data: Any) -> None:
         """订单更新事件处理器"""
-        if self.socket_server:
-            await self.socket_server.send_push("order", data.model_dump())
-        else:
-            logger.info(f"订单更新: {data}")
+        await self._push("order", data)
 
-    async def _on_trade_update(self, data):
+    async def _on_trade_update(self, data: Any) -> None:
         """成交更新事件处理器"""
-        if self.socket_server:
-            await self.socket_server.send_push("trade", data.model_dump())
-        else:
-            logger.info(f"成交更新: {data}")
+        await self._push("trade", data)
 
-    async def _on_position_update(self, data):
+    async def _on_position_update(self, data: Any) -> None:
         """持仓更新事件处理器"""
-        if self.socket_server:
-            await self.socket_server.send_push("position", data.model_dump())
-        else:
-            logger.info(f"持仓更新: {data}")
+        await self._push("position", data)
 
-    async def _on_tick_update(self, data):
+    async def _on_tick_update(self, data: Any) -> None:
         """行情更新事件处理器"""
-        if self.socket_server:
-            # 行情数据不实时推送，按需订阅
-            await self.socket_server.send_push("tick", data.model_dump())
-            pass
+        await self._push("tick", data)
 
     def _register_event_handlers(self) -> None:
         """
         注册事件处理器（推送到Manager）
 
+        需在SocketServer创建后调用
         """
-        # 注册到 AsyncEventEngine
+        if not self.socket_server:
+            logger.warning(f"Trader [{self.account_id}] SocketServer未创建，跳过事件处理器注册")
+            return
+
+        # 注册到 AsyncEventEngine（处理器为绑定方法，重复注册时由事件引擎去重）
         event_engine: AsyncEventEngine = ctx.get_event_engine()
         event_engine.register(EventTypes.ACCOUNT_UPDATE, self._on_account_update)
         event_engine.register(EventTypes.ACCOUNT_STATUS, self._on_account_update)
@@ -428,8 +436,6 @@ class Trader:
             return None
 
         try:
-            from src.models.object import Direction, Offset
-
             symbol = data["symbol"]
             direction = Direction(data["direction"])
             offset = Offset(data["offset"])
@@ -496,26 +502,28 @@ class Trader:
             return None
         order_id = data.get("order_id")
         if order_id:
-            order = self.trading_engine.orders.get(order_id)
+            order = self.trading_engine.get_order(order_id)
             if order:
                 return order.model_dump()
         return None
 
     @request("get_orders")
     async def _req_get_orders(self, data: dict) -> list:
-        """处理获取所有订单数据请求"""
+        """处理获取订单数据请求，指定status时只返回该状态的订单"""
         if self.trading_engine is None:
             return []
-        orders = self.trading_engine.orders
-        return [order.model_dump() for order in orders.values()]
+        orders = self.trading_engine.iter_orders()
+        status = data.get("status")
+        if status:
+            orders = (order for order in orders if order.status == status)
+        return [order.model_dump() for order in orders]
 
     @request("get_active_orders")
     async def _req_get_active_orders(self, data: dict) -> list:
         """处理获取活动订单请求"""
         if self.trading_engine is None:
             return []
-        orders = self.trading_engine.orders
-        return [order.model_dump() for order in orders.values() if order.status == "ACTIVE"]
+        return [order.model_dump() for order in self.trading_engine.iter_active_orders()]
 
     @request("get_trade")
     async def _req_get_trade(self, data: dict) -> Optional[dict]:
@@ -524,7 +532,7 @@ class Trader:
             return None
         trade_id = data.get("trade_id")
         if trade_id:
-            trade = self.trading_engine.trades.get(trade_id)
+            trade = self.trading_engine.get_trade(trade_id)
             if trade:
                 return trade.model_dump()
         return None
@@ -534,16 +542,14 @@ class Trader:
         """处理获取所有成交数据请求"""
         if self.trading_engine is None:
             return []
-        trades = self.trading_engine.trades
-        return [trade.model_dump() for trade in trades.values()]
+        return [trade.model_dump() for trade in self.trading_engine.iter_trades()]
 
     @request("get_positions")
     async def _req_get_positions(self, data: dict) -> list:
         """处理获取所有持仓数据请求"""
         if self.trading_engine is None:
             return []
-        positions = self.trading_engine.positions
-        return [pos.model_dump() for pos in positions.values()]
+        return [pos.model_dump() for pos in self.trading_engine.iter_positions()]
 
     @request("get_quotes")
     async def _req_get_quotes(self, data: dict) -> list:
@@ -977,8 +983,7 @@ class Trader:
             new_pos_short_yd = position_data.get("pos_short_yd", 0)
 
             # 检查账户持仓限制
-            account_positions = self.trading_engine.positions
-            account_position = account_positions.get(symbol)
+            account_position = self.trading_engine.get_position(symbol)
 
             if account_position:
                 # 获取账户持仓数量
@@ -1248,9 +1253,6 @@ class Trader:
             return {"success": False, "message": f"策略 {strategy_id} 不存在"}
 
         try:
-            from src.models.object import Direction, Offset
-            from src.trader.order_cmd import OrderCmd
-
             order_cmd = OrderCmd(
                 symbol=order_cmd_data["symbol"],
                 direction=Direction(order_cmd_data["direction"]),
@@ -8,7 +8,7 @@ import math
 import time
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Union
 
 import pandas as pd
 from sqlalchemy import or_
@@ -27,6 +27,7 @@ from src.models.object import (
     TradeData,
 )
 from src.models.po import SystemParamPo
+from src.trader.gateway import create_gateway
 from src.trader.order_cmd import OrderCmd, OrderCmdStatus, SplitStrategyType
 from src.trader.order_executor import OrderCmdExecutor
 from src.trader.risk_control import RiskControl
@@ -119,7 +120,7 @@ class TradingEngine:
         return self.gateway.connected
 
     @property
-    def trades(self):
+    def trades(self) -> Mapping[str, TradeData]:
         if self.gateway is None:
             return {}
         return self.gateway.get_trades()
@@ -149,7 +150,7 @@ class TradingEngine:
         return account
 
     @property
-    def orders(self):
+    def orders(self) -> Mapping[str, OrderData]:
         if self.gateway is None:
             return {}
         return self.gateway.get_orders()
@@ -164,7 +165,7 @@ class TradingEngine:
         return datetime.strptime(trading_day, "%Y%m%d")
 
     @property
-    def positions(self):
+    def positions(self) -> Mapping[str, PositionData]:
         if self.gateway is None:
             return {}
         return self.gateway.get_positions()
@@ -176,7 +177,9 @@ class TradingEngine:
         return self.gateway.get_quotes()
     
     def get_contract(self, symbol: str):
-        return self.gateway.get_contracts().get(symbol, None)
+        if self.gateway is None:
+            return None
+        return self.gateway.get_contract(symbol)
 
     def reload_risk_control_config(self):
         """
@@ -202,14 +205,8 @@ class TradingEngine:
         gateway_config.account_id = self.account_id
         gateway_type = gateway_config.type
         logger.info(f"创建Gateway，类型: {gateway_type}")
-        if gateway_type == "CTP":
-            from src.trader.gateway.ctp_gateway import CtpGateway
-            self.gateway = CtpGateway(self.config)
-            logger.info("CTP Gateway创建成功(框架实现，需CTP SDK)")
-        else:  # 默认TQSDK
-            from src.trader.gateway.tq_gateway import TqGateway
-            self.gateway = TqGateway(self.config)
-            logger.info("TqSdk Gateway创建成功")
+        self.gateway = create_gateway(gateway_type, self.config)
+        logger.info(f"{type(self.gateway).__name__} 创建成功")
 
 
         # 初始化异步事件引擎
@@ -424,6 +421,34 @@ class TradingEngine:
                 },
             )
 
+    def get_order(self, order_id: str) -> Optional[OrderData]:
+        """
+        获取单个订单（通过Gateway）
+
+        Args:
+            order_id: 订单ID
+
+        Returns:
+            Optional[OrderData]: 订单数据，不存在返回None
+        """
+        if self.gateway:
+            return self.gateway.get_order(order_id)
+        return None
+
+    def get_trade(self, trade_id: str) -> Optional[TradeData]:
+        """
+        获取单笔成交（通过Gateway）
+
+        Args:
+            trade_id: 成交ID
+
+        Returns:
+            Optional[TradeData]: 成交数据，不存在返回None
+        """
+        if self.gateway:
+            return self.gateway.get_trade(trade_id)
+        return None
+
     def get_position(self, symbol: str) -> Optional[PositionData]:
         """
         获取合约持仓数据（通过Gateway）
@@ -435,9 +460,53 @@ class TradingEngine:
             Optional[PositionData]: 持仓数据，失败返回None
         """
         if self.gateway:
-            return self.gateway.get_positions().get(symbol, None)
+            return self.gateway.get_position(symbol)
         return None
 
+    def iter_positions(self) -> Iterator[PositionData]:
+        """
+        遍历持仓数据（通过Gateway，不构造持仓字典）
+
+        Returns:
+            Iterator[PositionData]: 持仓迭代器
+        """
+        if self.gateway is None:
+            return iter(())
+        return self.gateway.iter_positions()
+
+    def iter_orders(self) -> Iterator[OrderData]:
+        """
+        遍历订单数据（通过Gateway，不构造订单字典）
+
+        Returns:
+            Iterator[OrderData]: 订单迭代器
+        """
+        if self.gateway is None:
+            return iter(())
+        return self.gateway.iter_orders()
+
+    def iter_active_orders(self) -> Iterator[OrderData]:
+        """
+        遍历活动订单（通过Gateway，跳过已完成订单）
+
+        Returns:
+            Iterator[OrderData]: 活动订单迭代器
+        """
+        if self.gateway is None:
+            return iter(())
+        return self.gateway.iter_active_orders()
+
+    def iter_trades(self) -> Iterator[TradeData]:
+        """
+        遍历成交数据（通过Gateway，不构造成交字典）
+
+        Returns:
+            Iterator[TradeData]: 成交迭代器
+        """
+        if self.gateway is None:
+            return iter(())
+        return self.gateway.iter_trades()
+
     def get_status(self) -> Dict[str, Any]:
         """
         获取引擎状态
@@ -451,6 +520,7 @@ class TradingEngine:
             "account_id": getattr(self.account, "user_id", "") if self.account else "",
             "daily_orders": self.risk_control.daily_order_count,
             "daily_cancels": self.risk_control.daily_cancel_count,
+            "dropped_events": self.gateway.dropped_events if self.gateway else 0,
         }
 
     def get_kline(self, symbol: str, interval: str) -> Optional[pd.DataFrame]:
@@ -484,6 +554,20 @@ class TradingEngine:
             return self.gateway.subscribe(symbol)
         return True
 
+    def is_subscribing(self, symbol: str) -> bool:
+        """
+        合约行情是否仍在订阅中
+
+        Args:
+            symbol: 合约代码
+
+        Returns:
+            bool: 已登记订阅但行情尚未就绪返回True
+        """
+        if self.gateway is None:
+            return False
+        return self.gateway.is_subscribing(symbol)
+
     def subscribe_bars(self, symbol: str, interval: str) -> bool:
         """
         订阅合约行情（通过Gateway）
@@ -4,8 +4,9 @@
 
 import asyncio
 import logging
+import threading
 from collections import defaultdict
-from typing import Any, Awaitable, Callable, Optional
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
 
 from src.utils.logger import get_logger
 
@@ -19,6 +20,8 @@ class Event:
     object which contains the real data.
     """
 
+    __slots__ = ("type", "data")
+
     def __init__(self, type: str, data: Any = None) -> None:
         self.type: str = type
         self.data: Any = data
@@ -36,6 +39,9 @@ class AsyncEventEngine:
     2. 异步支持：处理器可以是async或sync函数
     3. 并发处理：同一事件类型的处理器并发执行
     4. 通用处理器：支持注册处理所有事件的通用处理器
+
+    处理器列表采用写时复制的元组：注册/注销时整体替换，分发时直接遍历当前元组，
+    处理器内注册/注销不会影响正在进行的分发。
     """
 
     def __init__(self, name: str = "AsyncEventEngine") -> None:
@@ -48,8 +54,10 @@ class AsyncEventEngine:
         self._name = name
         self._running = False
         self._queue: asyncio.Queue = asyncio.Queue()
-        self._handlers: defaultdict = defaultdict(list)
-        self._general_handlers: list = []
+        self._handlers: defaultdict = defaultdict(tuple)
+        self._general_handlers: tuple = ()
+        # 仅用于串行化注册/注销（写操作），分发无锁
+        self._register_lock = threading.Lock()
         self._process_task: Optional[asyncio.Task] = None
 
     async def _process(self, event: Event) -> None:
@@ -64,9 +72,10 @@ class AsyncEventEngine:
         """
         try:
             # 分发给特定类型的处理器（并发执行）
-            if event.type in self._handlers:
+            handlers = self._handlers.get(event.type)
+            if handlers:
                 tasks = []
-                for handler in self._handlers[event.type]:
+                for handler in handlers:
                     if asyncio.iscoroutinefunction(handler):
                         tasks.append(asyncio.create_task(handler(event.data)))
                     else:
@@ -106,8 +115,13 @@ class AsyncEventEngine:
         """
         while self._running:
             try:
-                event = await self._queue.get()
-                await self._process(event)
+                item = await self._queue.get()
+                if isinstance(item, list):
+                    # 批量事件：按顺序逐个分发
+                    for event in item:
+                        await self._process(event)
+                else:
+                    await self._process(item)
             except asyncio.CancelledError:
                 logger.info(f"[{self._name}] 事件循环被取消")
                 break
@@ -175,6 +189,29 @@ class AsyncEventEngine:
         except Exception as e:
             logger.error(f"[{self._name}] 发送事件失败: {e}")
 
+    def put_batch(self, events: List[Tuple[str, Any]]) -> None:
+        """
+        批量发送事件到队列
+
+        整批事件只占用一个队列槽位，由处理循环按顺序分发，
+        用于合并高频事件以减少队列唤醒次数。
+
+        Args:
+            events: (事件类型, 事件数据) 列表
+        """
+        if not events:
+            return
+        if not self._running:
+            logger.warning(f"[{self._name}] 事件引擎未运行，丢弃批量事件: {len(events)}条")
+            return
+
+        try:
+            self._queue.put_nowait([Event(event_type, data) for event_type, data in events])
+        except asyncio.QueueFull:
+            logger.error(f"[{self._name}] 事件队列已满，丢弃批量事件: {len(events)}条")
+        except Exception as e:
+            logger.error(f"[{self._name}] 发送批量事件失败: {e}")
+
     async def put_async(self, event_type: str, data: Any) -> None:
         """
         异步发送事件到队列
@@ -200,9 +237,12 @@ class AsyncEventEngine:
             event_type: 事件类型
             handler: 处理器函数，接收事件数据作为参数
         """
-        if handler not in self._handlers[event_type]:
-            self._handlers[event_type].append(handler)
-            logger.debug(f"[{self._name}] 注册事件处理器: {event_type}")
+        with self._register_lock:
+            handlers = self._handlers[event_type]
+            if handler in handlers:
+                return
+            self._handlers[event_type] = handlers + (handler,)
+        logger.debug(f"[{self._name}] 注册事件处理器: {event_type}")
 
     def unregister(self, event_type: str, handler: HandlerType) -> None:
         """
@@ -212,13 +252,12 @@ class AsyncEventEngine:
             event_type: 事件类型
             handler: 处理器函数
         """
-        handler_list = self._handlers[event_type]
-
-        if handler in handler_list:
-            handler_list.remove(handler)
-
-        if not handler_list:
-            self._handlers.pop(event_type)
+        with self._register_lock:
+            handlers = tuple(h for h in self._handlers.get(event_type, ()) if h != handler)
+            if handlers:
+                self._handlers[event_type] = handlers
+            else:
+                self._handlers.pop(event_type, None)
 
     def register_general(self, handler: HandlerType) -> None:
         """
@@ -230,9 +269,11 @@ class AsyncEventEngine:
         Args:
             handler: 处理器函数，接收事件数据作为参数
         """
-        if handler not in self._general_handlers:
-            self._general_handlers.append(handler)
-            logger.debug(f"[{self._name}] 注册通用事件处理器")
+        with self._register_lock:
+            if handler in self._general_handlers:
+                return
+            self._general_handlers = self._general_handlers + (handler,)
+        logger.debug(f"[{self._name}] 注册通用事件处理器")
 
     def unregister_general(self, handler: HandlerType) -> None:
         """
@@ -241,8 +282,8 @@ class AsyncEventEngine:
         Args:
             handler: 处理器函数
         """
-        if handler in self._general_handlers:
-            self._general_handlers.remove(handler)
+        with self._register_lock:
+            self._general_handlers = tuple(h for h in self._general_handlers if h != handler)
 
     @property
     def running(self) -> bool:
@@ -251,6 +292,7 @@ class AsyncEventEngine:
 
     def clear(self) -> None:
         """清空所有处理器"""
-        self._handlers.clear()
-        self._general_handlers.clear()
+        with self._register_lock:
+            self._handlers.clear()
+            self._general_handlers = ()
         logger.debug(f"[{self._name}] 已清空所有处理器")
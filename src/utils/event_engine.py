@@ -6,7 +6,7 @@ import asyncio
 import inspect
 from collections import defaultdict
 from queue import Empty, Queue
-from threading import Thread
+from threading import Lock, Thread
 from typing import Any, Callable
 
 from src.utils.logger import logger
@@ -50,6 +50,8 @@ class Event:
     object which contains the real data.
     """
 
+    __slots__ = ("type", "data")
+
     def __init__(self, type: str, data: Any = None) -> None:
         """"""
         self.type: str = type
@@ -66,6 +68,8 @@ class EventEngine:
     1. 事件分发：根据事件类型将事件分发给注册的处理器
     2. 线程安全：使用Queue和Thread实现线程安全的事件处理
     3. 通用处理器：支持注册处理所有事件的通用处理器
+
+    处理器列表采用写时复制的元组：注册/注销时整体替换，分发线程直接读取当前元组，无需加锁。
     """
 
     def __init__(self, name: str = "EventEngine") -> None:
@@ -79,8 +83,10 @@ class EventEngine:
         self._queue: Queue = Queue()
         self._active: bool = False
         self._thread: Thread = Thread(target=self._run, daemon=True)
-        self._handlers: defaultdict = defaultdict(list)
-        self._general_handlers: list = []
+        self._handlers: defaultdict = defaultdict(tuple)
+        self._general_handlers: tuple = ()
+        # 仅用于串行化注册/注销（写操作），分发无锁
+        self._register_lock = Lock()
 
     def _run(self) -> None:
         """
@@ -107,14 +113,14 @@ class EventEngine:
         """
         try:
             # 分发给特定类型的处理器
-            if event.type in self._handlers:
-                for handler in self._handlers[event.type]:
+            handlers = self._handlers.get(event.type)
+            if handlers:
+                for handler in handlers:
                     self._call_handler(handler, event)
 
             # 分发给通用处理器
-            if self._general_handlers:
-                for handler in self._general_handlers:
-                    self._call_handler(handler, event)
+            for handler in self._general_handlers:
+                self._call_handler(handler, event)
         except Exception as e:
             logger.exception(f"[{self._name}] 事件处理异常: {e}")
 
@@ -186,8 +192,10 @@ class EventEngine:
             event_type: 事件类型
             handler: 处理器函数，接收 Event 对象作为参数
         """
-        if handler not in self._handlers[event_type]:
-            self._handlers[event_type].append(handler)
+        with self._register_lock:
+            handlers = self._handlers[event_type]
+            if handler not in handlers:
+                self._handlers[event_type] = handlers + (handler,)
 
     def unregister(self, event_type: str, handler: HandlerType) -> None:
         """
@@ -197,13 +205,12 @@ class EventEngine:
             event_type: 事件类型
             handler: 处理器函数
         """
-        handler_list: list = self._handlers[event_type]
-
-        if handler in handler_list:
-            handler_list.remove(handler)
-
-        if not handler_list:
-            self._handlers.pop(event_type)
+        with self._register_lock:
+            handlers = tuple(h for h in self._handlers.get(event_type, ()) if h != handler)
+            if handlers:
+                self._handlers[event_type] = handlers
+            else:
+                self._handlers.pop(event_type, None)
 
     def register_general(self, handler: HandlerType) -> None:
         """
@@ -214,8 +221,9 @@ class EventEngine:
         Args:
             handler: 处理器函数，接收 Event 对象作为参数
         """
-        if handler not in self._general_handlers:
-            self._general_handlers.append(handler)
+        with self._register_lock:
+            if handler not in self._general_handlers:
+                self._general_handlers = self._general_handlers + (handler,)
 
     def unregister_general(self, handler: HandlerType) -> None:
         """
@@ -224,5 +232,5 @@ class EventEngine:
         Args:
             handler: 处理器函数
         """
-        if handler in self._general_handlers:
-            self._general_handlers.remove(handler)
+        with self._register_lock:
+            self._general_handlers = tuple(h for h in self._general_handlers if h != handler)
@@ -29,7 +29,7 @@ class MessageType(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageBody:
     """消息体结构"""
 
@@ -72,13 +72,6 @@ class MessageEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
-def message_decode_hook(dct):
-    """JSON解码钩子"""
-    if "__bytes__" in dct:
-        return bytes.fromhex(dct["__bytes__"])
-    return dct
-
-
 class MessageProtocol:
     """消息协议处理器"""
 
@@ -126,12 +119,26 @@ class MessageProtocol:
             if len(data) < 4 + length:
                 return None
 
-            # 解析JSON
-            json_data = data[4 : 4 + length].decode("utf-8")
-            message_dict = json.loads(json_data, object_hook=message_decode_hook)
+            return self._decode_body(data[4 : 4 + length])
+        except struct.error as e:
+            logger.error(f"Failed to decode message: {e}")
+            return None
+
+    def _decode_body(self, body: bytes) -> Optional[MessageBody]:
+        """
+        解码报文体（不含长度头）
+
+        Args:
+            body: JSON报文体字节
 
+        Returns:
+            消息体对象，解码失败返回None
+        """
+        try:
+            # 不使用object_hook，整个报文由C扩展一次解析完成
+            message_dict = json.loads(body.decode("utf-8"))
             return MessageBody.from_dict(message_dict)
-        except (struct.error, json.JSONDecodeError, UnicodeDecodeError) as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             logger.error(f"Failed to decode message: {e}")
             return None
 
@@ -157,9 +164,8 @@ class MessageProtocol:
             # 读取消息体
             message_data = await reader.readexactly(total_length)
 
-            # 解码消息
-            full_data = length_data + message_data
-            return self.decode(full_data)
+            # 直接解码报文体，避免拼接长度头后再切片的两次拷贝
+            return self._decode_body(message_data)
 
         except (asyncio.IncompleteReadError, ConnectionError):
             # 连接已关闭
@@ -7,11 +7,15 @@
 """
 
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from loguru import logger
 
+# 同类异常完整堆栈的最小输出间隔（秒）
+ERROR_LOG_INTERVAL = 10.0
+
 
 def setup_logger(
     app_name: str,
@@ -104,3 +108,36 @@ def get_logger(name: Optional[str] = None):
     if name:
         return logger.bind(name=name)
     return logger
+
+
+class ErrorLogThrottle:
+    """
+    高频路径异常日志限流器
+
+    同一key在间隔内只输出一次完整堆栈，其余仅计数，下次输出时附带省略次数，
+    避免每轮/每个tick都格式化堆栈造成日志风暴。
+    """
+
+    def __init__(self, interval: float = ERROR_LOG_INTERVAL):
+        self.interval = interval
+        self._last_logged: Dict[object, float] = {}
+        self._suppressed: Dict[object, int] = {}
+
+    def exception(self, key: object, message: str) -> None:
+        """
+        记录异常日志（需在except块中调用）
+
+        Args:
+            key: 限流key（需可哈希），通常为异常类型
+            message: 日志内容
+        """
+        now = time.monotonic()
+        last = self._last_logged.get(key)
+        if last is not None and now - last < self.interval:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return
+        self._last_logged[key] = now
+        suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            message = f"{message} (期间省略{suppressed}次同类异常)"
+        logger.opt(depth=1, exception=True).error(message)
@@ -64,7 +64,7 @@ class TestAsyncEventEngineInitialization:
         from collections import defaultdict
         assert isinstance(event_engine._handlers, defaultdict)
         assert len(event_engine._handlers) == 0
-        assert isinstance(event_engine._general_handlers, list)
+        assert isinstance(event_engine._general_handlers, tuple)
         assert len(event_engine._general_handlers) == 0
 
 
@@ -218,6 +218,14 @@ class TestAsyncEventEnginePut:
         # 未运行时 put 不应该抛出异常
         event_engine.put("TEST_EVENT", {"data": "test"})
 
+    def test_put_batch_uses_single_queue_slot(self, event_engine: AsyncEventEngine):
+        """测试 put_batch() 整批只占用一个队列槽位"""
+        event_engine.start()
+
+        event_engine.put_batch([("EVENT1", 1), ("EVENT2", 2)])
+
+        assert event_engine._queue.qsize() == 1
+
     @pytest.mark.asyncio
     async def test_put_async_sends_to_queue(self, event_engine: AsyncEventEngine):
         """测试 put_async() 异步发送到队列"""
@@ -281,6 +289,38 @@ class TestAsyncEventEngineProcess:
         # handler2 应该仍然被调用
         handler2.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_register_during_dispatch_uses_snapshot(self, event_engine: AsyncEventEngine):
+        """测试分发中注册的处理器不参与当前事件"""
+        late_handler = MagicMock()
+
+        def handler(data):
+            event_engine.register("TEST_EVENT", late_handler)
+
+        event_engine.register("TEST_EVENT", handler)
+        event_engine.start()
+
+        event_engine.put("TEST_EVENT", 1)
+        await asyncio.sleep(0.1)
+        late_handler.assert_not_called()
+
+        event_engine.put("TEST_EVENT", 2)
+        await asyncio.sleep(0.1)
+        late_handler.assert_called_once_with(2)
+
+    @pytest.mark.asyncio
+    async def test_batch_events_dispatched_in_order(self, event_engine: AsyncEventEngine):
+        """测试批量事件按顺序分发"""
+        received = []
+        event_engine.register("EVENT1", lambda data: received.append(data))
+        event_engine.register("EVENT2", lambda data: received.append(data))
+        event_engine.start()
+
+        event_engine.put_batch([("EVENT1", 1), ("EVENT2", 2), ("EVENT1", 3)])
+        await asyncio.sleep(0.1)
+
+        assert received == [1, 2, 3]
+
     @pytest.mark.asyncio
     async def test_general_handler_receives_all_events(self, event_engine: AsyncEventEngine):
         """测试通用处理器接收所有事件"""
@@ -1,3 +1,5 @@
+import time
+
 import pytest
 from unittest.mock import patch, MagicMock
 from datetime import datetime
@@ -21,6 +23,13 @@ class TestEvent:
         assert event.type == "test.event"
         assert event.data is None
 
+    def test_event_has_no_instance_dict(self):
+        """测试事件对象使用 __slots__，不能附加任意属性"""
+        event = Event(type="test.event")
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.extra = 1
+
 
 @pytest.mark.unit
 class TestEventEngine:
@@ -198,6 +207,32 @@ class TestEventEngine:
         
         engine.stop()
     
+    def test_unregister_during_dispatch_uses_snapshot(self):
+        """测试分发中注销处理器不影响当前事件"""
+        engine = EventEngine()
+        engine.start()
+
+        calls = []
+
+        def first_handler(event: Event):
+            calls.append("first")
+            engine.unregister("test.event", second_handler)
+
+        def second_handler(event: Event):
+            calls.append("second")
+
+        engine.register("test.event", first_handler)
+        engine.register("test.event", second_handler)
+
+        engine.put("test.event", {})
+        engine.put("test.event", {})
+
+        time.sleep(0.1)
+
+        assert calls == ["first", "second", "first"]
+
+        engine.stop()
+
     @patch('src.utils.event_engine.logger')
     def test_handler_exception_handling(self, mock_logger):
         """测试处理器异常处理"""
@@ -14,7 +14,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from src.utils.logger import enable_alarm_handler, get_logger, setup_logger
+from src.utils.logger import ErrorLogThrottle, enable_alarm_handler, get_logger, setup_logger
 
 
 # ==================== Fixtures ====================
@@ -376,3 +376,32 @@ class TestLoggerPerformance:
 
         # 性能应该合理（< 1秒）
         assert elapsed < 5.0
+
+
+# ==================== TestErrorLogThrottle ====================
+
+
+class TestErrorLogThrottle:
+    """ErrorLogThrottle 测试"""
+
+    def test_repeated_errors_logged_once_per_interval(self):
+        """测试间隔内同类异常只输出一次，下次输出附带省略次数"""
+        throttle = ErrorLogThrottle(interval=10.0)
+        with patch("src.utils.logger.logger") as mock_logger, patch(
+            "src.utils.logger.time.monotonic", side_effect=[0.0, 1.0, 2.0, 11.0]
+        ):
+            for _ in range(4):
+                throttle.exception(ValueError, "处理异常")
+
+        error = mock_logger.opt.return_value.error
+        assert error.call_count == 2
+        assert "省略2次" in error.call_args_list[1].args[0]
+
+    def test_different_keys_not_throttled_together(self):
+        """测试不同异常类型分别限流"""
+        throttle = ErrorLogThrottle(interval=10.0)
+        with patch("src.utils.logger.logger") as mock_logger:
+            throttle.exception(ValueError, "异常A")
+            throttle.exception(KeyError, "异常B")
+
+        assert mock_logger.opt.return_value.error.call_count == 2
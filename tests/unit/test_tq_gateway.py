@@ -33,8 +33,14 @@ from src.models.object import (
     TickData,
     TradeData,
 )
-from src.trader.gateway.tq_gateway import TqGateway
-from src.utils.config_loader import GatewayConfig, TianqinConfig, BrokerConfig
+from src.trader.gateway.tq_gateway import TqGateway, _parse_quote_datetime
+from src.utils.config_loader import (
+    BrokerConfig,
+    GatewayConfig,
+    TianqinConfig,
+    TraderConfig,
+    TradingConfig,
+)
 
 
 # ==================== Fixtures ====================
@@ -60,7 +66,13 @@ def gateway_config() -> GatewayConfig:
 @pytest.fixture
 def gateway(gateway_config: GatewayConfig) -> TqGateway:
     """创建 TqGateway 实例"""
-    return TqGateway(config=gateway_config)
+    return TqGateway(
+        TraderConfig(
+            account_id=gateway_config.account_id,
+            gateway=gateway_config,
+            trading=TradingConfig(),
+        )
+    )
 
 
 @pytest.fixture
@@ -315,6 +327,94 @@ class TestTqGatewaySubscribe:
         # 应该允许重复添加到历史列表
         assert result is True
 
+    def test_subscribe_batches_quote_requests(self, gateway: TqGateway):
+        """测试多次订阅合并为一次get_quote_list请求"""
+        gateway.md_connected = True
+        gateway.td_connected = True
+        gateway.is_ready = True
+        gateway.api = MagicMock()
+        gateway.api.get_quote_list.side_effect = lambda symbols: [f"quote-{s}" for s in symbols]
+        gateway.contracts = {
+            symbol: MagicMock(symbol=symbol, exchange=Exchange.SHFE)
+            for symbol in ("rb2505", "hc2505")
+        }
+        gateway.std_symbol = MagicMock(side_effect=lambda symbol: symbol)
+
+        gateway.subscribe(["rb2505"])
+        gateway.subscribe(["hc2505"])
+        assert not gateway.api.get_quote_list.called
+
+        gateway._flush_subscriptions()
+
+        gateway.api.get_quote_list.assert_called_once()
+        assert gateway._quotes["rb2505"] == "quote-SHFE.rb2505"
+        assert gateway._quotes["hc2505"] == "quote-SHFE.hc2505"
+        assert not gateway._pending_subs
+
+    def test_subscribe_unknown_contract_returns_false(self, gateway: TqGateway):
+        """测试无合约信息的合约不登记订阅并返回False"""
+        gateway.md_connected = True
+        gateway.td_connected = True
+        gateway.is_ready = True
+        gateway.contracts = {"rb2505": MagicMock(symbol="rb2505", exchange=Exchange.SHFE)}
+        gateway.std_symbol = MagicMock(side_effect=lambda symbol: symbol)
+
+        assert gateway.subscribe(["rb2505", "xx9999"]) is False
+        assert gateway._pending_subs == {"rb2505"}
+        assert gateway.subscribe(["rb2505"]) is True
+
+    def test_flush_failure_keeps_pending(self, gateway: TqGateway):
+        """测试批量订阅请求失败时合约保留待订阅，下一轮重试成功"""
+        gateway.api = MagicMock()
+        gateway.api.get_quote_list.side_effect = [Exception("网络异常"), ["quote"]]
+        gateway.contracts = {"rb2505": MagicMock(symbol="rb2505", exchange=Exchange.SHFE)}
+        gateway.std_symbol = MagicMock(side_effect=lambda symbol: symbol)
+        gateway._pending_subs.add("rb2505")
+
+        gateway._flush_subscriptions()
+        assert gateway._pending_subs == {"rb2505"}
+        assert gateway.is_subscribing("rb2505")
+
+        gateway._flush_subscriptions()
+        assert gateway._quotes["rb2505"] == "quote"
+        assert not gateway._pending_subs
+        assert not gateway.is_subscribing("rb2505")
+
+    def test_register_then_market_order_waits_for_quote(self, gateway: TqGateway):
+        """测试注册指令后立即触发市价单时等待行情订阅完成，不消耗重试次数"""
+        from src.trader.order_cmd import OrderCmd
+        from src.trader.order_executor import OrderCmdExecutor
+
+        gateway.md_connected = True
+        gateway.td_connected = True
+        gateway.is_ready = True
+        gateway.api = MagicMock()
+        gateway.api.get_quote_list.side_effect = lambda symbols: [MagicMock() for _ in symbols]
+        gateway.contracts = {
+            "rb2505": MagicMock(symbol="rb2505", exchange=Exchange.SHFE, min_open_volume=None)
+        }
+        gateway.std_symbol = MagicMock(side_effect=lambda symbol: symbol)
+
+        trading_engine = MagicMock()
+        trading_engine.subscribe_symbol.side_effect = lambda symbol: gateway.subscribe([symbol])
+        trading_engine.is_subscribing.side_effect = gateway.is_subscribing
+        trading_engine.get_contract.side_effect = gateway.contracts.get
+        trading_engine.insert_order.return_value = None
+        executor = OrderCmdExecutor(MagicMock(), trading_engine)
+
+        cmd = OrderCmd(symbol="rb2505", direction=Direction.BUY, offset=Offset.OPEN, volume=1)
+        executor.register(cmd)
+        retry_times = cmd._left_retry_times
+
+        executor._process_cmd(cmd)
+        trading_engine.insert_order.assert_not_called()
+        assert cmd._left_retry_times == retry_times
+
+        gateway._flush_subscriptions()
+        executor._process_cmd(cmd)
+        trading_engine.insert_order.assert_called_once()
+        assert cmd._left_retry_times == retry_times - 1
+
 
 # ==================== TestTqGatewaySendOrder ====================
 
@@ -538,8 +638,11 @@ class TestTqGatewayDataConversion:
                     "status": "ALIVE",
                     "last_msg": "",
                     "insert_date_time": int(datetime.now().timestamp() * 1e9),
+                    "trade_price": 3500.0,
+                    "exchange_order_id": "",
                 }
                 # 添加直接属性访问
+                self.__dict__.update(self._data)
                 self.status = "ALIVE"
                 self.instrument_id = "rb2505"
                 self.exchange_id = "SHFE"
@@ -574,8 +677,11 @@ class TestTqGatewayDataConversion:
                     "status": "FINISHED",
                     "last_msg": "全部成交",
                     "insert_date_time": int(datetime.now().timestamp() * 1e9),
+                    "trade_price": 3500.0,
+                    "exchange_order_id": "",
                 }
                 # 添加直接属性访问
+                self.__dict__.update(self._data)
                 self.status = "FINISHED"
                 self.instrument_id = "rb2505"
                 self.exchange_id = "SHFE"
@@ -605,8 +711,11 @@ class TestTqGatewayDataConversion:
                     "status": "ALIVE",
                     "last_msg": "报单被拒绝",  # 包含错误关键词"拒绝"
                     "insert_date_time": int(datetime.now().timestamp() * 1e9),
+                    "trade_price": 3500.0,
+                    "exchange_order_id": "",
                 }
                 # 添加直接属性访问
+                self.__dict__.update(self._data)
                 self.status = "ALIVE"
                 self.instrument_id = "rb2505"
                 self.exchange_id = "SHFE"
@@ -624,7 +733,7 @@ class TestTqGatewayDataConversion:
     def test_convert_trade(self, gateway: TqGateway):
         """测试 _convert_trade() 转换成交数据"""
         mock_trade = MagicMock()
-        mock_trade.get = lambda k, d=None: {
+        trade_fields = {
             "trade_id": "test_trade",
             "order_id": "test_order",
             "instrument_id": "SHFE.rb2505",
@@ -634,7 +743,9 @@ class TestTqGatewayDataConversion:
             "price": 3500.0,
             "volume": 5,
             "trade_date_time": int(datetime.now().timestamp() * 1e9),
-        }.get(k, d)
+        }
+        for key, value in trade_fields.items():
+            setattr(mock_trade, key, value)
 
         result = gateway._convert_trade(mock_trade)
 
@@ -676,13 +787,13 @@ class TestTqGatewayDataConversion:
         """测试 _convert_tick() 转换行情数据"""
         now_ts = int(datetime.now().timestamp() * 1e9)
         mock_quote = MagicMock()
-        mock_quote.get = lambda k, d=None: {
+        quote_fields = {
             "instrument_id": "SHFE.rb2505",
             "exchange_id": "SHFE",
             "datetime": now_ts,
             "last_price": 3500.0,
             "volume": 10000,
-            "turnover": 35000000,
+            "amount": 35000000,
             "open_interest": 50000,
             "bid_price1": 3499.0,
             "ask_price1": 3501.0,
@@ -694,7 +805,9 @@ class TestTqGatewayDataConversion:
             "pre_open_interest": 49000,
             "upper_limit": 3650.0,
             "lower_limit": 3350.0,
-        }.get(k, d)
+        }
+        for key, value in quote_fields.items():
+            setattr(mock_quote, key, value)
 
         result = gateway._convert_tick(mock_quote)
 
@@ -724,6 +837,63 @@ class TestTqGatewayDataConversion:
         assert result.open_price == 3500.0
         assert result.close_price == 3505.0
 
+    def test_finished_order_converted_once(self, gateway: TqGateway):
+        """测试完成订单只转换一次，活动订单每次重新转换"""
+        finished = MagicMock(order_id="o1", status="FINISHED")
+        alive = MagicMock(order_id="o2", status="ALIVE")
+        gateway._orders = {"o1": finished, "o2": alive}
+        gateway._convert_order = MagicMock(side_effect=lambda order: MagicMock())
+
+        first = gateway.get_order("o1")
+        assert gateway.get_order("o1") is first
+        gateway.get_order("o2")
+        gateway.get_order("o2")
+
+        assert gateway._convert_order.call_count == 3
+
+    def test_order_cached_after_it_finishes(self, gateway: TqGateway):
+        """测试活动订单完成后缓存最终状态的转换结果"""
+        order = MagicMock(order_id="o1", status="ALIVE")
+        gateway._orders = {"o1": order}
+        gateway._convert_order = MagicMock(side_effect=lambda order: MagicMock(status=order.status))
+
+        assert gateway.get_order("o1").status == "ALIVE"
+        assert "o1" not in gateway._finished_order_cache
+
+        order.status = "FINISHED"
+        finished = gateway.get_order("o1")
+
+        assert finished.status == "FINISHED"
+        assert gateway._finished_order_cache["o1"] is finished
+        assert list(gateway.iter_orders()) == [finished]
+        assert gateway._convert_order.call_count == 2
+
+
+class TestParseQuoteDatetime:
+    """TqSdk 行情时间解析测试"""
+
+    def test_parse_datetime_string(self):
+        """测试解析 TqSdk 行情时间字符串"""
+        result = _parse_quote_datetime("2025-03-14 09:30:01.500000")
+
+        assert result == datetime(2025, 3, 14, 9, 30, 1, 500000)
+
+    def test_parse_nanosecond_timestamp(self):
+        """测试兼容纳秒时间戳"""
+        ts = datetime(2025, 3, 14, 9, 30, 1)
+
+        result = _parse_quote_datetime(int(ts.timestamp() * 1e9))
+
+        assert result == ts
+
+    def test_parse_empty_uses_now(self):
+        """测试无行情时间时使用当前时间"""
+        before = datetime.now()
+
+        result = _parse_quote_datetime("")
+
+        assert result >= before
+
 
 # ==================== TestTqGatewayIntervalConversion ====================
 
@@ -903,6 +1073,122 @@ class TestTqGatewayFormatSymbol:
         assert result is None
 
 
+# ==================== TestTqGatewayCollectUpdates ====================
+
+
+class TestTqGatewayCollectUpdates:
+    """TqGateway 数据变化收集测试"""
+
+    def test_changed_ticks_pushed_as_one_batch(self, gateway: TqGateway):
+        """测试本轮变化的行情合并为一个队列元素"""
+        quotes = {"SHFE.rb2505": MagicMock(), "SHFE.hc2505": MagicMock(), "DCE.m2505": MagicMock()}
+        changed = {id(quotes["SHFE.rb2505"]), id(quotes["DCE.m2505"])}
+        gateway.api = MagicMock()
+        gateway.api.is_changing.side_effect = lambda obj, *args: id(obj) in changed
+        gateway._quotes = quotes
+        gateway._convert_tick = MagicMock(side_effect=lambda quote: id(quote))
+
+        gateway._collect_and_push_updates()
+
+        event_type, ticks = gateway._sync_queue.get_nowait()
+        assert event_type == "ticks"
+        assert set(ticks) == changed
+        assert gateway._sync_queue.empty()
+
+    def test_changed_quotes_read_from_cycle_diffs(self, gateway: TqGateway):
+        """测试从本轮diff一次性汇总变化的行情，不逐个调用is_changing"""
+        rb_quote, hc_quote = MagicMock(), MagicMock()
+        rb_quote.instrument_id = "SHFE.rb2505"
+        hc_quote.instrument_id = "SHFE.hc2505"
+        gateway.api = MagicMock()
+        gateway.api.is_changing.return_value = False
+        gateway.api._sync_diffs = [{"quotes": {"SHFE.rb2505": {"last_price": 3500.0}}}]
+        gateway._quotes = {"rb2505": rb_quote, "hc2505": hc_quote}
+        gateway._convert_tick = MagicMock(side_effect=lambda quote: quote.instrument_id)
+
+        gateway._collect_and_push_updates()
+
+        assert gateway._sync_queue.get_nowait() == ("ticks", ["SHFE.rb2505"])
+        assert rb_quote not in [c.args[0] for c in gateway.api.is_changing.call_args_list]
+
+    def test_changed_trades_read_from_cycle_diffs(self, gateway: TqGateway):
+        """测试只推送本轮diff中出现的成交"""
+        trades = MagicMock()
+        trades._path = ["trade", "test_user", "trades"]
+        trades.__contains__.side_effect = lambda key: key in {"t1", "t2"}
+        trades.__getitem__.side_effect = lambda key: f"trade-{key}"
+        gateway.api = MagicMock()
+        gateway.api.is_changing.side_effect = lambda obj, *args: obj is trades
+        gateway.api._sync_diffs = [{"trade": {"test_user": {"trades": {"t2": {"price": 3500.0}}}}}]
+        gateway._trades = trades
+        gateway._convert_trade = MagicMock(side_effect=lambda trade: trade)
+
+        gateway._collect_and_push_updates()
+
+        assert gateway._sync_queue.get_nowait() == ("trade", "trade-t2")
+        assert gateway._sync_queue.empty()
+
+    def test_changed_keys_match_is_changing(self, gateway: TqGateway):
+        """测试同一份diff下_changed_keys与TqSdk的is_changing判断结果一致"""
+        from tqsdk import TqApi
+
+        api = TqApi.__new__(TqApi)
+        api._loop = MagicMock(is_running=MagicMock(return_value=False))
+        api._sync_diffs = [
+            {"quotes": {"SHFE.rb2505": {"last_price": 3500.0}}},
+            {"quotes": {"DCE.m2505": {"volume": 10}}, "trade": {"u": {"trades": {"t1": {}}}}},
+            {"quotes": {}},
+        ]
+        gateway.api = api
+
+        for path, keys in (
+            (["quotes"], ["SHFE.rb2505", "SHFE.hc2505", "DCE.m2505"]),
+            (["trade", "u", "trades"], ["t1", "t2"]),
+            (["trade", "u", "positions"], ["SHFE.rb2505"]),
+        ):
+            changed = gateway._changed_keys(path)
+            for key in keys:
+                assert (key in changed) == api.is_changing({"_path": path + [key]})
+
+    def test_changed_keys_none_without_sync_diffs(self, gateway: TqGateway):
+        """测试TqSdk不提供本轮diff时返回None，成交退回is_changing逐个判断"""
+        trades = {"t1": "trade-t1", "t2": "trade-t2"}
+        gateway.api = MagicMock(spec=["is_changing"])
+        gateway.api.is_changing.side_effect = lambda obj, *args: obj is trades or obj == "trade-t2"
+        gateway._trades = trades
+        gateway._convert_trade = MagicMock(side_effect=lambda trade: trade)
+
+        assert gateway._changed_keys(["quotes"]) is None
+
+        gateway._collect_and_push_updates()
+
+        assert gateway._sync_queue.get_nowait() == ("trade", "trade-t2")
+        assert gateway._sync_queue.empty()
+
+
+class TestTqGatewayPushAccount:
+    """TqGateway 账户推送测试"""
+
+    def test_unchanged_account_not_pushed(self, gateway: TqGateway):
+        """测试资金和连接状态无变化时不重复推送账户"""
+        account = AccountData(account_id="test", balance=1000000.0, available=900000.0)
+
+        gateway._push_account(account)
+        gateway._push_account(account.model_copy(update={"update_time": datetime.now()}))
+        gateway._push_account(account.model_copy(update={"available": 800000.0}))
+
+        assert gateway._sync_queue.qsize() == 2
+
+    def test_connection_change_pushed(self, gateway: TqGateway):
+        """测试资金不变但连接状态变化时仍推送账户"""
+        account = AccountData(account_id="test", balance=1000000.0, md_connected=True)
+
+        gateway._push_account(account)
+        gateway._push_account(account.model_copy(update={"md_connected": False}))
+
+        assert gateway._sync_queue.qsize() == 2
+
+
 # ==================== TestTqGatewayMapEventType ====================
 
 
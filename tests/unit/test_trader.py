@@ -75,6 +75,15 @@ def mock_trading_engine():
     engine.trades = {}
     engine.positions = {}
     engine.quotes = {}
+    engine.get_order = MagicMock(side_effect=lambda order_id: engine.orders.get(order_id))
+    engine.get_trade = MagicMock(side_effect=lambda trade_id: engine.trades.get(trade_id))
+    engine.get_position = MagicMock(side_effect=lambda symbol: engine.positions.get(symbol))
+    engine.iter_orders = MagicMock(side_effect=lambda: iter(engine.orders.values()))
+    engine.iter_active_orders = MagicMock(
+        side_effect=lambda: (order for order in engine.orders.values() if order.is_active())
+    )
+    engine.iter_trades = MagicMock(side_effect=lambda: iter(engine.trades.values()))
+    engine.iter_positions = MagicMock(side_effect=lambda: iter(engine.positions.values()))
     return engine
 
 
@@ -346,8 +355,8 @@ class TestEventHandlers:
     """测试事件处理器"""
 
     @pytest.mark.asyncio
-    async def test_on_account_update_with_socket(self, trader_instance, mock_socket_server):
-        """测试账户更新事件处理器（有Socket）"""
+    async def test_account_push_handler(self, trader_instance, mock_socket_server):
+        """测试账户更新推送处理器"""
         trader_instance.socket_server = mock_socket_server
         account_data = AccountData(
             account_id="test", balance=Decimal("1000"), available=Decimal("1000")
@@ -355,22 +364,21 @@ class TestEventHandlers:
 
         await trader_instance._on_account_update(account_data)
 
-        mock_socket_server.send_message.assert_called_once_with("account", account_data.model_dump())
+        mock_socket_server.send_push.assert_called_once_with("account", account_data.model_dump())
 
     @pytest.mark.asyncio
-    async def test_on_account_update_without_socket(self, trader_instance, caplog):
-        """测试账户更新事件处理器（无Socket）"""
-        trader_instance.socket_server = None
-        account_data = AccountData(
-            account_id="test", balance=Decimal("1000"), available=Decimal("1000")
-        )
+    async def test_push_handler_passes_dict_through(self, trader_instance, mock_socket_server):
+        """测试字典数据（如账户状态）直接推送"""
+        trader_instance.socket_server = mock_socket_server
+        status = {"account_id": "test", "status": "connected"}
+
+        await trader_instance._on_account_update(status)
 
-        with patch("src.trader.trader.logger"):
-            await trader_instance._on_account_update(account_data)
+        mock_socket_server.send_push.assert_called_once_with("account", status)
 
     @pytest.mark.asyncio
-    async def test_on_order_update_with_socket(self, trader_instance, mock_socket_server):
-        """测试订单更新事件处理器"""
+    async def test_order_push_handler(self, trader_instance, mock_socket_server):
+        """测试订单更新推送处理器"""
         trader_instance.socket_server = mock_socket_server
         order_data = OrderData(
             order_id="order_123",
@@ -381,63 +389,31 @@ class TestEventHandlers:
             volume=1,
             price=Decimal("3500"),
             traded=0,
-            status="ACTIVE",
+            status="PENDING",
         )
 
         await trader_instance._on_order_update(order_data)
 
-        mock_socket_server.send_message.assert_called_once_with("order", order_data.model_dump())
+        mock_socket_server.send_push.assert_called_once_with("order", order_data.model_dump())
 
     @pytest.mark.asyncio
-    async def test_on_trade_update_with_socket(self, trader_instance, mock_socket_server):
-        """测试成交更新事件处理器"""
+    async def test_handler_uses_current_socket_server(self, trader_instance, mock_socket_server):
+        """测试处理器推送时查找SocketServer，重建后推送到新的SocketServer"""
         trader_instance.socket_server = mock_socket_server
-        trade_data = TradeData(
-            trade_id="trade_123",
-            order_id="order_123",
-            symbol="SHFE.rb2505",
-            account_id="test_account_001",
-            direction=Direction.BUY,
-            offset=Offset.OPEN,
-            volume=1,
-            price=Decimal("3500"),
-        )
-
-        await trader_instance._on_trade_update(trade_data)
-
-        mock_socket_server.send_message.assert_called_once_with("trade", trade_data.model_dump())
-
-    @pytest.mark.asyncio
-    async def test_on_position_update_with_socket(self, trader_instance, mock_socket_server):
-        """测试持仓更新事件处理器"""
-        trader_instance.socket_server = mock_socket_server
-        position_data = PositionData(
-            symbol="SHFE.rb2505",
-            exchange=Exchange.SHFE,
-            pos=1,
-            pos_long=1,
-            pos_short=0,
-        )
-
-        await trader_instance._on_position_update(position_data)
-
-        mock_socket_server.send_message.assert_called_once_with("position", position_data.model_dump())
+        handler = trader_instance._on_tick_update
+        new_socket_server = MagicMock(send_push=AsyncMock())
+        trader_instance.socket_server = new_socket_server
 
-    @pytest.mark.asyncio
-    async def test_on_tick_update(self, trader_instance, mock_socket_server):
-        """测试行情更新事件处理器（不推送）"""
-        trader_instance.socket_server = mock_socket_server
         tick_data = TickData(
             symbol="SHFE.rb2505",
             exchange=Exchange.SHFE,
             datetime=datetime.now(),
             last_price=Decimal("3500"),
         )
+        await handler(tick_data)
 
-        await trader_instance._on_tick_update(tick_data)
-
-        # 行情数据不推送
-        mock_socket_server.send_message.assert_not_called()
+        mock_socket_server.send_push.assert_not_called()
+        new_socket_server.send_push.assert_called_once_with("tick", tick_data.model_dump())
 
 
 # ==================== Test Event Registration ====================
@@ -446,27 +422,49 @@ class TestEventHandlers:
 class TestEventRegistration:
     """测试事件注册"""
 
-    def test_register_event_handlers(self, trader_instance, mock_event_engine):
+    def test_register_event_handlers(self, trader_instance, mock_event_engine, mock_socket_server):
         """测试注册事件处理器"""
-        with patch(
-            "src.trader.trader.get_app_context",
-            return_value=MagicMock(get_event_engine=MagicMock(return_value=mock_event_engine)),
-        ):
+        trader_instance.socket_server = mock_socket_server
+        with patch("src.trader.trader.ctx") as mock_ctx:
+            mock_ctx.get_event_engine.return_value = mock_event_engine
+            trader_instance._register_event_handlers()
+
+        from src.utils.event_engine import EventTypes
+
+        registered = [c.args[0] for c in mock_event_engine.register.call_args_list]
+        assert registered == [
+            EventTypes.ACCOUNT_UPDATE,
+            EventTypes.ACCOUNT_STATUS,
+            EventTypes.ORDER_UPDATE,
+            EventTypes.TRADE_UPDATE,
+            EventTypes.POSITION_UPDATE,
+            EventTypes.TICK_UPDATE,
+        ]
+
+    def test_register_event_handlers_twice_deduplicated(self, trader_instance, mock_socket_server):
+        """测试重复注册时事件引擎按绑定方法去重，不会重复推送"""
+        from src.utils.async_event_engine import AsyncEventEngine
+        from src.utils.event_engine import EventTypes
+
+        event_engine = AsyncEventEngine()
+        trader_instance.socket_server = mock_socket_server
+        with patch("src.trader.trader.ctx") as mock_ctx:
+            mock_ctx.get_event_engine.return_value = event_engine
+            trader_instance._register_event_handlers()
             trader_instance._register_event_handlers()
 
-            # 检查所有事件类型都已注册
-            from src.utils.event_engine import EventTypes
+        assert event_engine._handlers[EventTypes.ORDER_UPDATE] == (
+            trader_instance._on_order_update,
+        )
 
-            expected_calls = [
-                call(EventTypes.ACCOUNT_UPDATE, trader_instance._on_account_update),
-                call(EventTypes.ACCOUNT_STATUS, trader_instance._on_account_update),
-                call(EventTypes.ORDER_UPDATE, trader_instance._on_order_update),
-                call(EventTypes.TRADE_UPDATE, trader_instance._on_trade_update),
-                call(EventTypes.POSITION_UPDATE, trader_instance._on_position_update),
-                call(EventTypes.TICK_UPDATE, trader_instance._on_tick_update),
-            ]
+    def test_register_event_handlers_without_socket(self, trader_instance, mock_event_engine):
+        """测试SocketServer未创建时跳过注册"""
+        trader_instance.socket_server = None
+        with patch("src.trader.trader.ctx") as mock_ctx:
+            mock_ctx.get_event_engine.return_value = mock_event_engine
+            trader_instance._register_event_handlers()
 
-            mock_event_engine.register.assert_has_calls(expected_calls, any_order=True)
+        mock_event_engine.register.assert_not_called()
 
 
 # ==================== Test Socket Request Handlers ====================
@@ -679,7 +677,7 @@ class TestSocketRequestHandlers:
             volume=1,
             price=Decimal("3500"),
             traded=0,
-            status=OrderStatus.NOTTRADED.value,
+            status=OrderStatus.PENDING,
         )
         order_filled = OrderData(
             order_id="order_filled",
@@ -690,7 +688,7 @@ class TestSocketRequestHandlers:
             volume=1,
             price=Decimal("3500"),
             traded=1,
-            status=OrderStatus.ALLTRADED.value,
+            status=OrderStatus.FINISHED,
         )
         running_trader.trading_engine.orders = {
             "order_active": order_active,
@@ -699,11 +697,37 @@ class TestSocketRequestHandlers:
 
         result = await running_trader._req_get_active_orders({})
 
-        # Only ACTIVE status orders are returned
-        # Change to use SUBMITTING or NOTTRADED which are considered active
+        # 仅返回未完结（PENDING）的订单
         assert len(result) == 1
         assert result[0]["order_id"] == "order_active"
 
+    @pytest.mark.asyncio
+    async def test_req_get_orders_by_status(self, running_trader):
+        """测试按状态获取订单"""
+        from src.models.object import OrderStatus
+
+        running_trader.trading_engine.orders = {
+            order_id: OrderData(
+                order_id=order_id,
+                symbol="SHFE.rb2505",
+                account_id="test_account_001",
+                direction=Direction.BUY,
+                offset=Offset.OPEN,
+                volume=1,
+                price=Decimal("3500"),
+                status=status,
+            )
+            for order_id, status in (
+                ("order_pending", OrderStatus.PENDING),
+                ("order_finished", OrderStatus.FINISHED),
+                ("order_rejected", OrderStatus.REJECTED),
+            )
+        }
+
+        result = await running_trader._req_get_orders({"status": "REJECTED"})
+
+        assert [order["order_id"] for order in result] == ["order_rejected"]
+
     @pytest.mark.asyncio
     async def test_req_get_trade_existing(self, running_trader):
         """测试获取存在的成交"""
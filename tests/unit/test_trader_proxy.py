@@ -58,15 +58,17 @@ def socket_path(tmp_path):
 
 
 @pytest.fixture
-def trader_proxy(mock_account_config, mock_global_config, socket_path):
-    """创建 TraderProxy 实例"""
-    with patch("src.manager.trader_proxy.ctx"), patch("src.manager.trader_proxy.get_app_context"):
-        proxy = TraderProxy(
-            mock_account_config,
-            mock_global_config,
-            socket_path,
-            heartbeat_timeout=30,
-        )
+def trader_proxy(mock_account_config, tmp_path):
+    """创建 TraderProxy 实例（使用模拟的应用配置，不读取配置文件）"""
+    app_config = MagicMock()
+    app_config.paths.socket_dir = str(tmp_path)
+    with (
+        patch("src.manager.trader_proxy.ctx"),
+        patch("src.manager.trader_proxy.get_app_context"),
+        patch("src.manager.trader_proxy.get_config_loader") as mock_loader,
+    ):
+        mock_loader.return_value._load_app_config.return_value = app_config
+        proxy = TraderProxy(mock_account_config, heartbeat_timeout=30)
         return proxy
 
 
@@ -646,14 +648,18 @@ class TestTraderProxyMessageHandling:
         with patch("src.manager.trader_proxy.ctx", MagicMock(get_event_engine=MagicMock(return_value=mock_event_engine))):
             trader_proxy._emit_data("order", {"order_id": "test"})
 
-            mock_event_engine.put.assert_called_once_with("e:order.update", {"order_id": "test"})
+            mock_event_engine.put_batch.assert_called_once_with(
+                [("e:order.update", {"order_id": "test"})]
+            )
 
     def test_emit_data_trade(self, trader_proxy, mock_event_engine):
         """测试emit成交数据"""
         with patch("src.manager.trader_proxy.ctx", MagicMock(get_event_engine=MagicMock(return_value=mock_event_engine))):
             trader_proxy._emit_data("trade", {"trade_id": "test"})
 
-            mock_event_engine.put.assert_called_once_with("e:trade.created", {"trade_id": "test"})
+            mock_event_engine.put_batch.assert_called_once_with(
+                [("e:trade.created", {"trade_id": "test"})]
+            )
 
     def test_emit_data_position(self, trader_proxy, mock_event_engine):
         """测试emit持仓数据"""
@@ -667,7 +673,9 @@ class TestTraderProxyMessageHandling:
         with patch("src.manager.trader_proxy.ctx", MagicMock(get_event_engine=MagicMock(return_value=mock_event_engine))):
             trader_proxy._emit_data("tick", {"symbol": "test"})
 
-            mock_event_engine.put.assert_called_once_with("e:tick.update", {"symbol": "test"})
+            mock_event_engine.put_batch.assert_called_once_with(
+                [("e:tick.update", {"symbol": "test"})]
+            )
 
     def test_emit_data_unknown_type(self, trader_proxy, mock_event_engine):
         """测试emit未知类型"""
@@ -946,6 +954,30 @@ class TestTraderProxyDataQuery:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_contracts_cached(self, trader_proxy, mock_socket_client):
+        """测试合约列表在有效期内复用缓存"""
+        trader_proxy.socket_client = mock_socket_client
+        mock_socket_client.request = AsyncMock(return_value=[{"symbol": "SHFE.rb2505"}])
+
+        first = await trader_proxy.get_contracts()
+        second = await trader_proxy.get_contracts()
+
+        assert first == second == [{"symbol": "SHFE.rb2505"}]
+        mock_socket_client.request.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_refresh_contracts_invalidates_cache(self, trader_proxy, mock_socket_client):
+        """测试强制刷新合约后缓存失效"""
+        trader_proxy.socket_client = mock_socket_client
+        mock_socket_client.request = AsyncMock(return_value=[{"symbol": "SHFE.rb2505"}])
+        await trader_proxy.get_contracts()
+
+        mock_socket_client.request = AsyncMock(return_value={"success": True})
+        await trader_proxy.refresh_contracts()
+
+        assert trader_proxy._contracts_cache is None
+
 
 # ==================== Test Trading Methods ====================
 
@@ -1335,6 +1367,40 @@ class TestTraderProxyEdgeCases:
 
         assert result["start_time"] is None
 
+    @pytest.mark.skipif(not os.path.exists("/proc/self/stat"), reason="需要 /proc 文件系统")
+    def test_status_proc_stats_throttled(self, trader_proxy):
+        """测试进程资源采样按间隔节流"""
+        trader_proxy.process = MagicMock(pid=os.getpid())
+
+        first = trader_proxy.get_status()
+        with patch("builtins.open", side_effect=AssertionError("不应重复采样")):
+            second = trader_proxy.get_status()
+
+        assert first["memory_usage"] > 0
+        assert second["memory_usage"] == first["memory_usage"]
+
+    def test_status_proc_stats_without_sysconf(self, trader_proxy):
+        """测试不支持sysconf的平台不读取 /proc 并返回0"""
+        trader_proxy.process = MagicMock(pid=os.getpid())
+
+        with (
+            patch("src.manager.trader_proxy._CLK_TCK", 0),
+            patch("builtins.open", side_effect=AssertionError("不应读取 /proc")),
+        ):
+            status = trader_proxy.get_status()
+
+        assert status["cpu_usage"] == 0.0
+        assert status["memory_usage"] == 0.0
+
+    def test_status_proc_stats_missing_proc(self, trader_proxy):
+        """测试 /proc 不可读时返回0"""
+        trader_proxy.process = MagicMock(pid=os.getpid())
+
+        with patch("builtins.open", side_effect=FileNotFoundError):
+            status = trader_proxy.get_status()
+
+        assert status["memory_usage"] == 0.0
+
     @pytest.mark.asyncio
     async def test_emit_data_no_event_engine(self, trader_proxy):
         """测试无事件引擎时emit"""
@@ -189,6 +189,21 @@ class TestTradingEngineProperties:
         assert "order_1" in result
         assert result["order_1"] == mock_order
 
+    def test_get_order_single_lookup(self, trading_engine, mock_gateway):
+        """测试按ID查询订单不复制全部订单"""
+        trading_engine.gateway = mock_gateway
+        mock_order = MagicMock()
+        mock_gateway.get_order.return_value = mock_order
+        assert trading_engine.get_order("order_1") is mock_order
+        mock_gateway.get_order.assert_called_once_with("order_1")
+        assert not mock_gateway.get_orders.called
+
+    def test_get_order_no_gateway(self, trading_engine):
+        """测试无Gateway时按ID查询订单"""
+        trading_engine.gateway = None
+        assert trading_engine.get_order("order_1") is None
+        assert trading_engine.get_trade("trade_1") is None
+
     def test_positions_property_no_gateway(self, trading_engine):
         """测试无Gateway时持仓数据"""
         trading_engine.gateway = None
@@ -204,6 +219,31 @@ class TestTradingEngineProperties:
         assert "pos_1" in result
         assert result["pos_1"] == mock_position
 
+    def test_iter_positions_with_gateway(self, trading_engine, mock_gateway):
+        """测试遍历持仓不构造持仓字典"""
+        trading_engine.gateway = mock_gateway
+        mock_position = MagicMock()
+        mock_gateway.iter_positions.return_value = iter([mock_position])
+        assert list(trading_engine.iter_positions()) == [mock_position]
+        assert not mock_gateway.get_positions.called
+
+    def test_iter_no_gateway(self, trading_engine):
+        """测试无Gateway时遍历数据"""
+        trading_engine.gateway = None
+        assert list(trading_engine.iter_positions()) == []
+        assert list(trading_engine.iter_orders()) == []
+        assert list(trading_engine.iter_trades()) == []
+        assert list(trading_engine.iter_active_orders()) == []
+
+    def test_get_contract_does_not_copy_contracts(self, trading_engine, mock_gateway):
+        """测试查询单个合约不复制全部合约"""
+        trading_engine.gateway = mock_gateway
+        mock_contract = MagicMock()
+        mock_gateway.get_contract.return_value = mock_contract
+        assert trading_engine.get_contract("rb2505") is mock_contract
+        mock_gateway.get_contract.assert_called_once_with("rb2505")
+        assert not mock_gateway.get_contracts.called
+
     def test_quotes_property_no_gateway(self, trading_engine):
         """测试无Gateway时行情数据"""
         trading_engine.gateway = None
@@ -469,11 +509,12 @@ class TestTradingEngineGetStatus:
         """测试获取引擎状态"""
         trading_engine.paused = False
 
-        with patch.object(trading_engine, "gateway", MagicMock(connected=True)):
+        with patch.object(trading_engine, "gateway", MagicMock(connected=True, dropped_events=3)):
             status = trading_engine.get_status()
 
             assert status["connected"] is True
             assert status["paused"] is False
+            assert status["dropped_events"] == 3
 
     def test_get_status_no_gateway(self, trading_engine):
         """测试无Gateway时获取状态"""
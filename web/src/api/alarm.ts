@@ -1,11 +1,13 @@
 import request from './request'
-import type { Alarm, AlarmStats, AlarmStatus } from '@/types'
+import type { Alarm, AlarmPage, AlarmStats, AlarmStatus } from '@/types'
 
 export const alarmApi = {
-  getTodayAlarms(statusFilter?: AlarmStatus): Promise<Alarm[]> {
+  getTodayAlarms(statusFilter?: AlarmStatus, limit?: number, offset?: number): Promise<AlarmPage> {
     return request.get('/alarm/list', {
       params: {
-        ...(statusFilter ? { status_filter: statusFilter } : {})
+        ...(statusFilter ? { status_filter: statusFilter } : {}),
+        ...(limit ? { limit } : {}),
+        ...(offset ? { offset } : {})
       }
     })
   },
@@ -203,6 +203,14 @@ export interface Alarm {
   created_at: string
 }
 
+/** 告警分页列表 */
+export interface AlarmPage {
+  alarms: Alarm[]
+  total: number
+  limit: number
+  offset: number
+}
+
 /** 告警统计 */
 export interface AlarmStats {
   today_total: number